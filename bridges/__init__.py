@@ -14,6 +14,7 @@ from bridges.element import *
 from bridges.element_visualizer import *
 from bridges.graph_adj_list import *
 from bridges.graph_adj_matrix import *
+from bridges.graph_csr import *
 from bridges.grid import *
 from bridges.link_visualizer import *
 from bridges.ml_element import *
@@ -0,0 +1,230 @@
+import heapq
+import numpy as np
+from bridges.graph_csr import GraphCSR
+
+##
+#
+#    @brief Reference implementations of classic graph algorithms
+#
+#    These functions work on the compressed sparse row snapshot of a graph
+#    (see GraphAdjList.freeze()) and accept a GraphAdjList, a SubgraphView
+#    or a GraphCSR. bfs(), shortest_path() and page_rank() have the prototypes
+#    expected by BFSBenchamrk, ShortestPathBenchmark and PageRankBenchmark,
+#    so they can be benchmarked as a baseline and used to check the results
+#    of other implementations. Results are keyed by vertex key.
+#
+#    \sa GraphCSR
+#
+
+def _snapshot(gr) -> GraphCSR:
+    if isinstance(gr, GraphCSR):
+        return gr
+    return gr.freeze()
+
+
+def _expand(csr, frontier):
+    # positions in targets of all the edges leaving the frontier vertices
+    starts = csr.offsets[frontier]
+    counts = csr.offsets[frontier + 1] - starts
+    shift = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return np.arange(counts.sum()) + shift, np.repeat(frontier, counts)
+
+
+def bfs_arrays(gr, root):
+    """
+    Breadth first search, level synchronous and vectorized over the frontier
+    Args:
+        gr: GraphAdjList, SubgraphView or GraphCSR
+        root: key of the vertex to start from
+    Returns:
+        (level, parent) arrays indexed by vertex index; -1 for vertices
+        that are not reached (the root is its own parent)
+    """
+    csr = _snapshot(gr)
+    n = csr.num_vertices
+    level = np.full(n, -1, dtype=np.int64)
+    parent = np.full(n, -1, dtype=np.int64)
+    r = csr.index_of(root)
+    level[r] = 0
+    parent[r] = r
+    frontier = np.array([r], dtype=np.int64)
+    depth = 0
+    while len(frontier):
+        depth += 1
+        edges, srcs = _expand(csr, frontier)
+        dests = csr.targets[edges]
+        new = level[dests] == -1
+        dests, srcs = dests[new], srcs[new]
+        # the first edge reaching a vertex gives its parent
+        frontier, first = np.unique(dests, return_index=True)
+        level[frontier] = depth
+        parent[frontier] = srcs[first]
+    return level, parent
+
+
+def bfs(gr, root, level: dict, parent: dict) -> None:
+    """
+    Breadth first search
+    Args:
+        gr: GraphAdjList, SubgraphView or GraphCSR
+        root: key of the vertex to start from
+        level: dict filled with the level of each reached vertex
+        parent: dict filled with the parent of each reached vertex
+         (the root is its own parent)
+    Returns:
+        None
+    """
+    csr = _snapshot(gr)
+    lv, par = bfs_arrays(csr, root)
+    keys = csr.keys
+    for i in np.nonzero(lv >= 0)[0].tolist():
+        level[keys[i]] = int(lv[i])
+        parent[keys[i]] = keys[par[i]]
+
+
+def shortest_path(gr, root, distance: dict, parent: dict) -> None:
+    """
+    Single source shortest paths (Dijkstra with a binary heap); edge data
+    are the weights, unweighted graphs use a weight of 1
+    Args:
+        gr: GraphAdjList, SubgraphView or GraphCSR
+        root: key of the source vertex
+        distance: dict filled with the distance of each reached vertex
+        parent: dict filled with the parent of each reached vertex
+         (the root is its own parent)
+    Returns:
+        None
+    """
+    csr = _snapshot(gr)
+    offsets = csr.offsets.tolist()
+    targets = csr.targets.tolist()
+    weights = [1.0] * len(targets) if csr.weights is None else csr.weights.tolist()
+    dist = [float('inf')] * csr.num_vertices
+    par = [-1] * csr.num_vertices
+    r = csr.index_of(root)
+    dist[r] = 0.0
+    par[r] = r
+    heap = [(0.0, r)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            nd = d + weights[e]
+            if nd < dist[v]:
+                dist[v] = nd
+                par[v] = u
+                heapq.heappush(heap, (nd, v))
+    keys = csr.keys
+    for i, d in enumerate(dist):
+        if par[i] != -1:
+            distance[keys[i]] = d
+            parent[keys[i]] = keys[par[i]]
+
+
+def connected_components(gr) -> dict:
+    """
+    Connected components, ignoring the direction of edges. Union-find by
+    hooking every edge onto the smaller root and compressing paths by
+    pointer jumping, all vertices at once.
+    Args:
+        gr: GraphAdjList, SubgraphView or GraphCSR
+    Returns:
+        dict: vertex key to component id (the smallest vertex index in the
+        component)
+    """
+    csr = _snapshot(gr)
+    comp = component_array(csr)
+    return dict(zip(csr.keys, comp.tolist()))
+
+
+def component_array(gr):
+    """
+    Connected components as an array, see connected_components()
+    Args:
+        gr: GraphAdjList, SubgraphView or GraphCSR
+    Returns:
+        array of component ids indexed by vertex index
+    """
+    csr = _snapshot(gr)
+    comp = np.arange(csr.num_vertices)
+    srcs = csr.sources()
+    dests = csr.targets
+    while True:
+        # hook: the root of each endpoint takes the smaller of the two roots
+        low = np.minimum(comp[srcs], comp[dests])
+        changed = False
+        for ends in (srcs, dests):
+            roots = comp[ends]
+            hook = low < roots
+            if hook.any():
+                np.minimum.at(comp, roots[hook], low[hook])
+                changed = True
+        # jump: point every vertex to its root
+        while True:
+            jumped = comp[comp]
+            if np.array_equal(jumped, comp):
+                break
+            comp = jumped
+        if not changed:
+            return comp
+
+
+def page_rank(gr, pr: dict, damping: float = 0.85, tolerance: float = 1e-10,
+              max_iterations: int = 100) -> None:
+    """
+    PageRank by power iteration, each iteration being a few array
+    operations; the rank of vertices without outgoing edges is spread over
+    all vertices
+    Args:
+        gr: GraphAdjList, SubgraphView or GraphCSR
+        pr: dict filled with the rank of each vertex (ranks sum to 1)
+        damping: damping factor
+        tolerance: stop once the ranks change by less than this (L1 norm)
+        max_iterations: stop after this many iterations anyway
+    Returns:
+        None
+    """
+    csr = _snapshot(gr)
+    n = csr.num_vertices
+    if n == 0:
+        return
+    out = csr.out_degrees
+    srcs = csr.sources()
+    dangling = out == 0
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iterations):
+        share = np.where(dangling, 0.0, rank / np.maximum(out, 1))
+        new_rank = np.bincount(csr.targets, weights=share[srcs], minlength=n)
+        new_rank = (1 - damping) / n + damping * (new_rank + rank[dangling].sum() / n)
+        delta = np.abs(new_rank - rank).sum()
+        rank = new_rank
+        if delta < tolerance:
+            break
+    pr.update(zip(csr.keys, rank.tolist()))
+
+
+def degree_stats(gr) -> dict:
+    """
+    Summary of the degree distribution
+    Args:
+        gr: GraphAdjList, SubgraphView or GraphCSR
+    Returns:
+        dict: with "vertices", "edges", and for "out" and "in" degrees a dict
+        of min, max, mean, median and the key of a vertex of maximum degree
+    """
+    csr = _snapshot(gr)
+    ret = {"vertices": csr.num_vertices, "edges": csr.num_edges}
+    for name, degrees in (("out", csr.out_degrees), ("in", csr.in_degrees())):
+        if len(degrees) == 0:
+            ret[name] = None
+            continue
+        ret[name] = {
+            "min": int(degrees.min()),
+            "max": int(degrees.max()),
+            "mean": float(degrees.mean()),
+            "median": float(np.median(degrees)),
+            "max_vertex": csr.key_of(int(np.argmax(degrees)))
+        }
+    return ret
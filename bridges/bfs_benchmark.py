@@ -1,4 +1,5 @@
 from bridges.graph_benchmark import *
+from bridges import algorithms
 from bridges.line_chart import *
 from datetime import datetime
 import time as time_
@@ -44,11 +45,7 @@ class BFSBenchamrk(GraphBenchmark):
         vtx_count = []
         edge_cnt = []
 
-        years = 0
-        while years < 120:
-            year = 2019 - years
-            graph = GraphAdjList()
-            vertex_count, edge_count = self._genertate_wiki_data_movie_actor(int(year), 2019, graph)
+        for graph, vertex_count, edge_count in self._input_graphs():
             root = self._highest_degree_vertex(graph)
             level = dict()
             parent = dict()
@@ -56,13 +53,17 @@ class BFSBenchamrk(GraphBenchmark):
             bfsalgo(graph, root, level, parent)
             end = float((time_.time() * 1000))
             elapsed_time = end - start
+            if self.validate:
+                ref_level = dict()
+                algorithms.bfs(graph, root, ref_level, dict())
+                if ref_level != level:
+                    self._report_mismatch(algo_name, "levels", edge_count)
             time.append(elapsed_time)
             vtx_count.append(vertex_count)
             edge_cnt.append(edge_count)
 
             if elapsed_time > self.time_cap:
                 break
-            years = 1.2 * years + 1
 
         self.__plot.set_x_data(algo_name, edge_cnt)
         self.__plot.set_y_data(algo_name, time)
@@ -1,8 +1,8 @@
 from bridges.connector import *
 from bridges import ColorGrid
+from bridges import graph_encoding
 import os
 
-import json
 ##
 #     @brief The bridges class is the main class that provides interfaces to datasets,
 #    maintains user and assignment information, and connects to the bridges server.
@@ -139,7 +139,7 @@ class Bridges:
 
         ds.update(nodes_links_str)
 
-        ds_json = json.dumps(ds)
+        ds_json = graph_encoding.dumps(ds)
         if self._json_flag:
             print(ds_json)
 
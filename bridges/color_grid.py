@@ -1,6 +1,8 @@
 from bridges.color import *
 from bridges.grid import *
 import base64
+import traceback
+import numpy as np
 
 ##
 #  @brief This is a class in BRIDGES for representing an (n x n) grid.
@@ -18,6 +20,17 @@ import base64
 #  You can get a ColorGrid from an existing Bridges ColorGrid assignment using
 #  bridges.get_color_grid_from_assignment(bridges.get_username(), bridges.get_assignment_id(), 0)
 #
+#  The colors are stored as RGBA bytes in a (rows x cols x 4) numpy array,
+#  available through the pixels property, so whole images can be written at
+#  once instead of one Color at a time. The alpha set through set() is kept
+#  exactly alongside (the images sent only hold alpha bytes).
+#
+#  Unlike in earlier versions, the grid no longer holds the Color objects
+#  themselves: get() returns a new Color holding the cell's value, so
+#  changing that Color does not change the grid; use set(). The grid
+#  attribute is a view of the cells as rows of Colors, read and written
+#  through get() and set().
+#
 #  @author David Burlinson, Matthew McQuaigue
 #
 #  @date 2018, 7/24/19
@@ -46,9 +59,12 @@ class ColorGrid(Grid):
         Returns:
             None
         """
-        super(ColorGrid, self).__init__(rows=rows, cols=cols)
+        Grid.validate_size(rows, cols)
         self.base_color = color
         self.grid_size = [rows, cols]
+        self._pixels = np.empty((rows, cols, 4), dtype=np.uint8)
+        # alpha of each cell as set, the pixels only hold it on a byte
+        self._alpha = np.empty((rows, cols))
         self.initialize_grid()
 
     def initialize_grid(self) -> None:
@@ -57,9 +73,60 @@ class ColorGrid(Grid):
         Returns:
             None
         """
-        for i in range(self.grid_size[0]):
-            for j in range(self.grid_size[1]):
-                self.set(i, j, self.base_color)
+        self._pixels[:, :] = self.base_color.get_byte_representation()
+        self._alpha[:, :] = self.base_color.alpha
+
+    @property
+    def grid(self):
+        """
+        Getter for the cells of the color grid, as rows of Colors
+        Returns:
+            view of the rows; grid[row][col] is get(row, col), and
+            assigning to it calls set(row, col, color)
+        """
+        return _ColorGridRows(self)
+
+    @property
+    def pixels(self):
+        """
+        Getter for the pixel storage of the color grid
+        Returns:
+            numpy array of uint8, (rows x cols x 4) RGBA values; writing
+            to it changes the grid
+        """
+        return self._pixels
+
+    @pixels.setter
+    def pixels(self, rgba) -> None:
+        """
+        Setter for all the pixels of the color grid at once
+        Args:
+            rgba: array-like of (rows x cols x 4) RGBA values (0-255)
+        Returns:
+            None
+        """
+        self._pixels[:, :, :] = rgba
+        self._alpha[:, :] = self._pixels[:, :, 3] / 255.0
+
+    def get(self, row: int, col: int):
+        """
+        Get the (row, col) element in the color grid
+        Args:
+            row - which row to access
+            col - which col to access
+        Returns:
+            Color: color of the cell at row,col
+        """
+        try:
+            r, g, b, a = self._pixels[int(row), int(col)].tolist()
+            alpha = float(self._alpha[int(row), int(col)])
+            # unless the pixels were written directly since
+            if round(255 * alpha) != a:
+                alpha = a / 255.0
+            return Color(r, g, b, alpha)
+        except Exception as e:
+            traceback.print_tb(e.__traceback__)
+            return None
 
     def set(self, row: int, col: int, color: Color) -> None:
         """
@@ -71,7 +138,12 @@ class ColorGrid(Grid):
         Returns:
             None
         """
-        super(ColorGrid, self).set(row, col, color)
+        try:
+            self._pixels[int(row), int(col)] = color.get_byte_representation()
+            self._alpha[int(row), int(col)] = color.alpha
+        except Exception as e:
+            traceback.print_tb(e.__traceback__)
+            return None
 
     def get_rle(self) -> bytearray:
         """
@@ -79,51 +151,22 @@ class ColorGrid(Grid):
         Returns:
             bytearray
         """
-        img_bytes = bytearray()
-        count = 0
-        total_count = 0
-        pos = 0
-        last = self.grid[0][0]
-
-        while pos < self.grid_size[0] * self.grid_size[1]:
-            posY = pos / self.grid_size[1]
-            posX = pos % self.grid_size[1]
-            current = self.grid[int(posY)][int(posX)]
-
-            if count == 0:
-                count = 1
-                last = current
-            else:
-                if last == current:
-                    count += 1
-                else:
-                    total_count += count
-                    img_bytes.append(count-1)
-                    last = last.get_byte_representation()
-
-                    for k in range(len(last)):
-                        img_bytes.append(last[k])
-
-                    count = 1
-                    last = current
-            if count == 256:
-                total_count += count
-                img_bytes.append(count-1)
-                last = last.get_byte_representation()
-                for k in range(len(last)):
-                    img_bytes.append(last[k])
-                count = 0
-            pos += 1
-        total_count += count
-        img_bytes.append(count-1)
-        last = last.get_byte_representation()
-        for k in range(len(last)):
-            img_bytes.append(last[k])
-
-        if total_count != self.grid_size[0] * self.grid_size[1]:
-            print("Something broke in getRLE construction")
-
-        return img_bytes
+        flat = self._pixels.reshape(-1, 4)
+        # one 32-bit word per pixel makes runs easy to find
+        words = np.ascontiguousarray(flat).view(np.uint32).ravel()
+        starts = np.concatenate(([0], np.nonzero(words[1:] != words[:-1])[0] + 1))
+        lengths = np.diff(np.append(starts, len(words)))
+
+        # runs longer than 256 are split, the count is stored on a byte
+        chunks = (lengths + 255) // 256
+        chunk_run = np.repeat(np.arange(len(starts)), chunks)
+        chunk_pos = np.arange(len(chunk_run)) - np.repeat(np.cumsum(chunks) - chunks, chunks)
+        chunk_len = np.minimum(256, lengths[chunk_run] - 256 * chunk_pos)
+
+        img_bytes = np.empty((len(chunk_run), 5), dtype=np.uint8)
+        img_bytes[:, 0] = chunk_len - 1
+        img_bytes[:, 1:] = flat[starts[chunk_run]]
+        return bytearray(img_bytes.tobytes())
 
     def get_raw(self) -> bytearray:
         """
@@ -131,16 +174,7 @@ class ColorGrid(Grid):
         Returns:
             bytearray: representing the colors of grid cells
         """
-        img_bytes = bytearray()
-        for i in range(self.grid_size[0]):
-            if self.grid[i] is not None:
-                for j in range(self.grid_size[1]):
-                    if self.grid[i][j] is not None:
-                        color = self.grid[i][j]
-                        color = color.get_byte_representation()
-                        for k in range(len(color)):
-                            img_bytes.append(color[k])
-        return img_bytes
+        return bytearray(self._pixels.tobytes())
 
     def get_data_structure_representation(self) -> dict:
         """
@@ -165,3 +199,41 @@ class ColorGrid(Grid):
         }
 
         return json_dict
+
+
+class _ColorGridRows:
+    # rows of a ColorGrid, see ColorGrid.grid
+
+    def __init__(self, grid):
+        self._grid = grid
+
+    def __getitem__(self, row):
+        return _ColorGridRow(self._grid, row)
+
+    def __len__(self):
+        return self._grid.grid_size[0]
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+
+class _ColorGridRow:
+    # a row of a ColorGrid, reading and writing its cells
+
+    def __init__(self, grid, row):
+        self._grid = grid
+        self._row = row
+
+    def __getitem__(self, col):
+        return self._grid.get(self._row, col)
+
+    def __setitem__(self, col, color):
+        self._grid.set(self._row, col, color)
+
+    def __len__(self):
+        return self._grid.grid_size[1]
+
+    def __iter__(self):
+        for col in range(len(self)):
+            yield self[col]
@@ -0,0 +1,76 @@
+from bridges import generators
+from bridges.data_src_dependent.movie_actor_wiki_data import MovieActorWikiData
+
+##
+#
+#    @brief Builds the bipartite graph of actors and movies from the records
+#    of get_wiki_data_actor_movie() or get_actor_movie_imdb_data()
+#
+#    Each record links an actor to a movie. Vertices are keyed by the
+#    Wikidata URI of the actor or movie, or for IMDB records, which only
+#    hold names, by ("movie", name) or ("actor", name) so that a movie and
+#    an actor of the same name stay apart. Vertices hold the names, which
+#    are also their labels. Movies and actors are interned into dense
+#    indices while the records are read (movies first, then actors),
+#    duplicate pairs are dropped, and the graph is built at once from the
+#    arrays of edges, each pair being linked in both directions.
+#
+#    @code
+#    graph = actor_movie_graph(get_wiki_data_actor_movie(2010, 2011))
+#    @endcode
+#
+#    \sa get_wiki_data_actor_movie(), get_actor_movie_imdb_data(),
+#        generators.graph_from_edges()
+#
+
+
+def _record_fields(rec):
+    # (movie key, movie name, actor key, actor name) of a record
+    if isinstance(rec, MovieActorWikiData):
+        return rec.movie_uri, rec.movie_name, rec.actor_uri, rec.actor_name
+    return ("movie", rec.movie), rec.movie, ("actor", rec.actor), rec.actor
+
+
+def actor_movie_graph(records, adj_list: bool = True, graph=None):
+    """
+    Build the undirected actor-movie graph of the records
+    Args:
+        records: list of MovieActorWikiData or ActorMovieIMDB
+        adj_list: return a GraphAdjList instead of a GraphCSR
+        graph: empty GraphAdjList to fill (implies adj_list), a new one if
+         None
+    Returns:
+        GraphAdjList or GraphCSR: movies and actors, with their names as
+        vertex data (GraphAdjList only)
+    """
+    movies = dict()
+    actors = dict()
+    movie_names = []
+    actor_names = []
+    srcs = []
+    dests = []
+    for rec in records:
+        movie, movie_name, actor, actor_name = _record_fields(rec)
+        m = movies.get(movie)
+        if m is None:
+            m = movies[movie] = len(movie_names)
+            movie_names.append(movie_name)
+        a = actors.get(actor)
+        if a is None:
+            a = actors[actor] = len(actor_names)
+            actor_names.append(actor_name)
+        srcs.append(m)
+        dests.append(a)
+    # actors are numbered after the movies
+    keys = list(movies) + list(actors)
+    names = movie_names + actor_names
+    csr = generators.graph_from_edges(len(keys), srcs, [len(movies) + a for a in dests], directed=False,
+                                      keys=keys)
+    if graph is None and not adj_list:
+        return csr
+    graph = generators.to_adj_list(csr, values=names, graph=graph)
+    # vertices are labeled by name rather than by key
+    vertices = graph.vertices
+    for k, name in zip(keys, names):
+        vertices[k].label = str(name)
+    return graph
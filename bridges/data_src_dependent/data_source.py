@@ -1,6 +1,7 @@
 import json
 import requests
 import pickle
+import numpy as np
 from bridges.data_src_dependent import earthquake_usgs
 from bridges.data_src_dependent import actor_movie_imdb
 from bridges.data_src_dependent import game
@@ -10,11 +11,12 @@ from bridges.data_src_dependent import cancer_incidence
 from bridges.data_src_dependent import song
 from bridges.data_src_dependent import lru_cache
 from bridges.data_src_dependent import movie_actor_wiki_data
+from bridges.data_src_dependent import elevation_cache
 from bridges.data_src_dependent.osm import *
 from bridges.data_src_dependent.elevation import *
 from bridges.data_src_dependent.actor_movie_imdb import *
+from bridges.data_src_dependent.actor_movie_graph import actor_movie_graph
 from bridges.color_grid import ColorGrid
-from bridges.color import Color
 from SPARQLWrapper import SPARQLWrapper, JSON
 
 
@@ -462,51 +464,27 @@ def get_color_grid_from_assignment(server: str, user: str, assignment: int, suba
 
         import base64
         decoded_bytes = bytearray(base64.b64decode(node_string))
-        decoded = [int(x) for x in decoded_bytes]
     except AttributeError:
         raise RuntimeError("Malformed JSON: Unable to Parse. Does this assignment exist?")
 
     color_grid = ColorGrid(dim_x, dim_y)
 
     if encoding == "RAW":
-        if len(decoded) != dim_x * dim_y * 4:
+        if len(decoded_bytes) != dim_x * dim_y * 4:
             raise RuntimeError("Malformed ColorGrid JSON: nodes is not the size we expect for RAW encoding")
 
-        base = 0
-        for x in range(0, dim_x):
-            for y in range(0, dim_y):
-                color = Color(decoded[base],
-                              decoded[base + 1],
-                              decoded[base + 2],
-                              (decoded[base + 3]/255.0)
-                              )
-                color_grid.set(x, y, color)
-                base = base + 4
+        color_grid.pixels = np.frombuffer(decoded_bytes, dtype=np.uint8).reshape(dim_x, dim_y, 4)
 
     elif encoding == "RLE":
-        if len(decoded) % 5:
+        if len(decoded_bytes) % 5:
             raise RuntimeError("Malformed ColorGrid JSON: RLE nodes are not a multiple of 5")
-        current_in_decoded = 0
-        current_in_cg = 0
-        while current_in_decoded != len(decoded):
-            repeat = decoded[current_in_decoded]
-
-            color = Color(decoded[current_in_decoded + 1],
-                          decoded[current_in_decoded + 2],
-                          decoded[current_in_decoded + 3],
-                          (decoded[current_in_decoded + 4] / 255.0)
-                          )
-            current_in_decoded = current_in_decoded + 5
-
-            while repeat >= 0:
-                pos_x = int(current_in_cg / dim_y)
-                pos_y = int(current_in_cg % dim_y)
-                if pos_x >= dim_x or pos_y >= dim_y:
-                    raise RuntimeError("Malformed ColorGrid JSON: Too much data in nodes")
-
-                color_grid.set(pos_x, pos_y, color)
-                current_in_cg = current_in_cg + 1
-                repeat = repeat - 1
+        runs = np.frombuffer(decoded_bytes, dtype=np.uint8).reshape(-1, 5)
+        repeats = runs[:, 0].astype(np.int64) + 1
+        if repeats.sum() > dim_x * dim_y:
+            raise RuntimeError("Malformed ColorGrid JSON: Too much data in nodes")
+
+        flat = color_grid.pixels.reshape(-1, 4)
+        flat[:repeats.sum()] = np.repeat(runs[:, 1:], repeats, axis=0)
 
     return color_grid
 
@@ -648,35 +626,17 @@ def elevation_server(url):
 
 
 
-def get_elevation_data(*args):
-    """This function returns elevation data for the requested
-    location and resolution. Note that the data returned may be for a
-    slightly different location and resolution than requested.
-
-    :param args[0]: a bounding box, aka an array [minLat, minLon, maxLat, maxLon]
-    :param args[1]: spatial resolution, aka the distance between two samples (in degrees)
-
-    :return EleData for the bounding box and resolution requested (approximately)
-    """
+def _elevation_request(bbox, res, lru):
     base_url = "http://cci-bridges-elevation-t.dyn.uncc.edu/elevation"
     hash_url = "http://cci-bridges-elevation-t.dyn.uncc.edu/hash"
 
-    coords = args[0]
-    minLat = coords[0]
-    minLon = coords[1]
-    maxLat = coords[2]
-    maxLon = coords[3]
+    minLat = bbox[0]
+    minLon = bbox[1]
+    maxLat = bbox[2]
+    maxLon = bbox[3]
 
-    res = .0166
-        
-    if len(args) == 2:
-        res = args[1]
-        
     url = base_url + f"?minLat={minLat}&minLon={minLon}&maxLat={maxLat}&maxLon={maxLon}&resX={res}&resY={res}"
     hash_url = hash_url + f"?minLat={minLat}&minLon={minLon}&maxLat={maxLat}&maxLon={maxLon}&resX={res}&resY={res}"
-    #loads cache
-    lru = lru_cache.lru_cache(30)
-
 
     data = None
     not_skip = True
@@ -692,30 +652,50 @@ def get_elevation_data(*args):
     hash = elevation_server(hash_url).decode('utf-8')
     lru.put(hash, data)
 
-    
     #parse and build object
-    ret_ele = EleData()
-    
-    file_array = data.splitlines()
-    ret_ele.cols = int(file_array[0].split(" ")[-1])
-    ret_ele.rows = int(file_array[1].split(" ")[-1])
-    ret_ele._xll = float(file_array[2].split(" ")[-1])
-    ret_ele._yll = float(file_array[3].split(" ")[-1])
-    ret_ele.cellsize = float(file_array[4].split(" ")[-1])
-
-    maxVal = -9999999999
-    x = 5
-    while (x < len(file_array)):
-        arr = file_array[x].replace("\n", "").split(" ")
-        arr.pop(0)
-        parsedline = []
-        for y in arr:
-            parsedline.append(int(y))
-            if(int(y) > maxVal):
-                maxVal = int(y)
-        ret_ele.data.append(parsedline)
-        x += 1
-    ret_ele.maxVal = maxVal
+    return EleData.from_ascii_grid(data)
+
+
+def get_elevation_data(*args):
+    """This function returns elevation data for the requested
+    location and resolution. Note that the data returned may be for a
+    slightly different location and resolution than requested.
+
+    Downloaded grids are kept in a local multi-resolution cache: requests
+    that are covered by finer or adjacent cached grids are answered
+    locally, and only the uncovered part of a request is downloaded.
+
+    :param args[0]: a bounding box, aka an array [minLat, minLon, maxLat, maxLon]
+    :param args[1]: spatial resolution, aka the distance between two samples (in degrees)
+
+    :return EleData for the bounding box and resolution requested (approximately)
+    """
+    coords = args[0]
+
+    res = .0166
+        
+    if len(args) == 2:
+        res = args[1]
+
+    #loads cache
+    lru = lru_cache.lru_cache(30)
+    ele_cache = elevation_cache.ElevationCache(lru)
+
+    ret_ele, missing = ele_cache.lookup(coords, res)
+    if missing is None:
+        return ret_ele
+
+    if missing == [[float(c) for c in coords]]:
+        # nothing cached around here, keep the server's grid as is
+        ret_ele = _elevation_request(coords, res, lru)
+        ele_cache.add(ret_ele, coords, res)
+        return ret_ele
+
+    for box in missing:
+        # pad by a cell since the server grid is not aligned with ours
+        box = [box[0] - res, box[1] - res, box[2] + res, box[3] + res]
+        ele_cache.add(_elevation_request(box, res, lru), box, res)
+    ret_ele, missing = ele_cache.lookup(coords, res)
 
     return ret_ele
 
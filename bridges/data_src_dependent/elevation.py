@@ -1,4 +1,22 @@
+import math
+import numpy as np
+from bridges.color_grid import ColorGrid
+
+# colormaps are lists of (position in [0, 1], (r, g, b)) stops
+colormaps = {
+    "gray": [(0.0, (0, 0, 0)), (1.0, (255, 255, 255))],
+    "terrain": [(0.0, (51, 102, 153)), (0.15, (0, 153, 102)), (0.3, (102, 204, 102)),
+                (0.5, (230, 217, 140)), (0.75, (153, 102, 51)), (1.0, (255, 255, 255))],
+    "heat": [(0.0, (0, 0, 0)), (0.4, (204, 0, 0)), (0.8, (255, 204, 0)), (1.0, (255, 255, 255))]
+}
+
+
 class EleData:
+    """Elevation data on a regular grid, as returned by the elevation server
+    (ESRI ASCII grid). The samples are held in a 2-D numpy array of
+    rows x cols, row 0 being the northernmost row; data[i][j] indexing
+    works as it did with lists of lists.
+    """
 
     @property
     def cols(self):
@@ -22,7 +40,8 @@ class EleData:
 
     @data.setter
     def data(self, eledata):
-        self._data = eledata
+        self._data = np.asarray(eledata)
+        self._update_range()
 
     @property
     def xll(self):
@@ -56,14 +75,246 @@ class EleData:
     def maxVal(self, value):
         self._maxVal = value
 
+    @property
+    def minVal(self):
+        return self._minVal
+
+    @minVal.setter
+    def minVal(self, value):
+        self._minVal = value
+
+    @property
+    def nodata(self):
+        """Value marking missing samples in the grid, None if the grid has none"""
+        return self._nodata
+
+    @nodata.setter
+    def nodata(self, value):
+        self._nodata = value
+        self._update_range()
+
+    def valid_mask(self):
+        """Boolean array, True where the grid holds an actual sample
+        :return: numpy array of bool with the shape of data
+        """
+        if self._nodata is None:
+            return np.ones(self._data.shape, dtype=bool)
+        return self._data != self._nodata
+
+    def stats(self) -> dict:
+        """Summary statistics of the elevation samples, ignoring missing ones
+        :return: dict with min, max, mean and std
+        """
+        values = self._data[self.valid_mask()]
+        if values.size == 0:
+            return {"min": None, "max": None, "mean": None, "std": None}
+        return {
+            "min": values.min().item(),
+            "max": values.max().item(),
+            "mean": float(values.mean()),
+            "std": float(values.std())
+        }
+
+    def sample(self, lats, lons, method: str = "nearest"):
+        """Elevation at many locations at once.
+        :param lats: latitude or array-like of latitudes
+        :param lons: longitude or array-like of longitudes (same shape as lats)
+        :param method: "nearest" for the value of the cell containing each
+            location, "bilinear" to interpolate between cell centers
+            (missing samples are left out and the weights of the others
+            renormalized)
+        :return: float for a single location, else a numpy array of float;
+            locations outside the grid or on missing samples are nan
+        """
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        rows, cols = self._data.shape
+        # fractional (row, col) position, row 0 being the northernmost
+        fy = (self._yll + rows * self._cellsize - lats) / self._cellsize
+        fx = (lons - self._xll) / self._cellsize
+        inside = (fy >= 0) & (fy <= rows) & (fx >= 0) & (fx <= cols)
+
+        def values(r, c):
+            v = np.array(self._data[r, c], dtype=np.float64)
+            if self._nodata is not None:
+                v[self._data[r, c] == self._nodata] = np.nan
+            return v
+
+        if method == "nearest":
+            r = np.clip(np.floor(fy).astype(np.int64), 0, rows - 1)
+            c = np.clip(np.floor(fx).astype(np.int64), 0, cols - 1)
+            ret = values(r, c)
+        elif method == "bilinear":
+            fy = np.clip(fy - 0.5, 0, rows - 1)
+            fx = np.clip(fx - 0.5, 0, cols - 1)
+            r0 = np.floor(fy).astype(np.int64)
+            c0 = np.floor(fx).astype(np.int64)
+            r1 = np.minimum(r0 + 1, rows - 1)
+            c1 = np.minimum(c0 + 1, cols - 1)
+            wy = fy - r0
+            wx = fx - c0
+            # missing samples get no weight, the others are renormalized
+            total = np.zeros(fy.shape)
+            weight = np.zeros(fy.shape)
+            for r, c, w in ((r0, c0, (1 - wx) * (1 - wy)), (r0, c1, wx * (1 - wy)),
+                            (r1, c0, (1 - wx) * wy), (r1, c1, wx * wy)):
+                v = values(r, c)
+                valid = ~np.isnan(v) & (w > 0)
+                total += np.where(valid, v * w, 0.0)
+                weight += np.where(valid, w, 0.0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                ret = np.where(weight > 0, total / np.where(weight > 0, weight, 1.0), np.nan)
+        else:
+            raise ValueError("method must be \"nearest\" or \"bilinear\"")
+
+        ret = np.where(inside, ret, np.nan)
+        if ret.ndim == 0:
+            return float(ret)
+        return ret
+
+    def profile(self, path, method: str = "bilinear", spacing: float = None):
+        """Elevation profile along a path.
+        :param path: list of (lat, lon) points
+        :param method: sampling method, see sample()
+        :param spacing: distance between two samples along the path (in
+            degrees), defaults to the cell size
+        :return: (distances, elevations) numpy arrays, distances in km
+            from the start of the path
+        """
+        path = np.asarray(path, dtype=np.float64).reshape(-1, 2)
+        if spacing is None:
+            spacing = self._cellsize
+        seg = np.diff(path, axis=0)
+        counts = np.maximum(1, np.ceil(np.hypot(seg[:, 0], seg[:, 1]) / spacing)).astype(np.int64)
+        # parameter along each segment, the end point of the path added last
+        seg_id = np.repeat(np.arange(len(seg)), counts)
+        frac = (np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)) / counts[seg_id]
+        points = np.vstack((path[seg_id] + seg[seg_id] * frac[:, None], path[-1:]))
+
+        earth_radius = 6378
+        lat = np.radians(points[:, 0])
+        lon = np.radians(points[:, 1])
+        a = (np.sin(np.diff(lat) / 2) ** 2 +
+             np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(np.diff(lon) / 2) ** 2)
+        steps = 2 * earth_radius * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+        distances = np.concatenate(([0.0], np.cumsum(steps)))
+        return distances, self.sample(points[:, 0], points[:, 1], method)
+
+    def to_color_grid(self, colormap="terrain", hillshade: bool = False,
+                      contour_interval=None, color_grid: ColorGrid = None) -> ColorGrid:
+        """Render the elevation into a ColorGrid in one vectorized pass.
+
+        Elevations are normalized between minVal and maxVal and mapped
+        through the colormap. Grids larger than the largest ColorGrid are
+        decimated to fit.
+        :param colormap: name of one of the colormaps, or a list of
+            (position, (r, g, b)) stops with positions from 0 to 1
+        :param hillshade: bool, shade the relief as lit from the north-west
+        :param contour_interval: elevation difference between two contour
+            lines, None to draw no contour lines
+        :param color_grid: ColorGrid to draw into (its size must match the
+            rendered size), a new one is created if None
+        :return: ColorGrid
+        """
+        stops = colormaps[colormap] if isinstance(colormap, str) else colormap
+        step = max(1, math.ceil(self._data.shape[0] / ColorGrid.maxGridSize[0]),
+                   math.ceil(self._data.shape[1] / ColorGrid.maxGridSize[1]))
+        elev = self._data[::step, ::step].astype(np.float32)
+        valid = self.valid_mask()[::step, ::step]
+
+        span = float(self._maxVal - self._minVal) or 1.0
+        t = np.clip((elev - self._minVal) / span, 0.0, 1.0)
+        positions = [p for p, c in stops]
+        rgb = np.empty(elev.shape + (3,), dtype=np.float32)
+        for channel in range(3):
+            rgb[..., channel] = np.interp(t, positions, [c[channel] for p, c in stops])
+
+        if hillshade:
+            rgb *= self._hillshade(elev, step)[..., None]
+
+        if contour_interval:
+            band = np.floor(elev / contour_interval)
+            edge = np.zeros(elev.shape, dtype=bool)
+            edge[:, 1:] |= band[:, 1:] != band[:, :-1]
+            edge[1:, :] |= band[1:, :] != band[:-1, :]
+            rgb[edge] *= 0.4
+
+        if color_grid is None:
+            color_grid = ColorGrid(elev.shape[0], elev.shape[1])
+        pixels = color_grid.pixels
+        pixels[..., :3] = np.clip(rgb, 0, 255).astype(np.uint8)
+        pixels[..., 3] = np.where(valid, 255, 0)
+        return color_grid
+
+    def _hillshade(self, elev, step, azimuth=315.0, altitude=45.0):
+        # cell size in meters, longitude cells shrink with the latitude
+        lat = math.radians(self._yll + self.nrows * self._cellsize / 2)
+        dy = self._cellsize * step * 111320.0
+        dx = dy * max(math.cos(lat), 1e-6)
+        grad_y, grad_x = np.gradient(elev, dy, dx)
+        slope = np.arctan(np.hypot(grad_x, grad_y))
+        aspect = np.arctan2(-grad_x, grad_y)
+        zenith = math.radians(90.0 - altitude)
+        az = math.radians(azimuth)
+        shade = (math.cos(zenith) * np.cos(slope) +
+                 math.sin(zenith) * np.sin(slope) * np.cos(az - aspect))
+        # keep some ambient light so that the colors stay readable
+        return 0.35 + 0.65 * np.clip(shade, 0.0, 1.0)
+
+    def _update_range(self):
+        if self._data.size == 0:
+            return
+        values = self._data[self.valid_mask()]
+        if values.size == 0:
+            return
+        self._minVal = values.min().item()
+        self._maxVal = values.max().item()
+
+    @classmethod
+    def from_ascii_grid(cls, text: str):
+        """Parse an ESRI ASCII grid into an EleData object
+        :param text: str, content of the grid file (header then rows of samples)
+        :return: EleData
+        """
+        ret_ele = cls()
+        header = {}
+        pos = 0
+        # header lines are "key value" pairs, the body starts at the first numeric line
+        while True:
+            end = text.find("\n", pos)
+            if end == -1:
+                end = len(text)
+            tokens = text[pos:end].split()
+            if len(tokens) != 2 or not tokens[0][0].isalpha():
+                break
+            header[tokens[0].lower()] = tokens[1]
+            pos = end + 1
+            if pos >= len(text):
+                break
+
+        ret_ele.cols = int(header["ncols"])
+        ret_ele.rows = int(header["nrows"])
+        ret_ele.xll = float(header.get("xllcorner", header.get("xllcenter", 0)))
+        ret_ele.yll = float(header.get("yllcorner", header.get("yllcenter", 0)))
+        ret_ele.cellsize = float(header["cellsize"])
+        if "nodata_value" in header:
+            ret_ele._nodata = int(float(header["nodata_value"]))
 
+        body = np.fromstring(text[pos:], dtype=np.int32, sep=" ")
+        if body.size != ret_ele.rows * ret_ele.cols:
+            raise RuntimeError("Malformed elevation data: expected " + str(ret_ele.rows * ret_ele.cols) +
+                               " samples, got " + str(body.size))
+        ret_ele.data = body.reshape(ret_ele.rows, ret_ele.cols)
+        return ret_ele
 
     def __init__(self):
         self.ncols = 0
         self.nrows = 0
-        self._data = []
+        self._data = np.zeros((0, 0), dtype=np.int32)
         self._xll = 0
         self._yll = 0
         self._cellsize = 0
         self.name = None
-        self._maxVal = 0
\ No newline at end of file
+        self._maxVal = 0
+        self._minVal = 0
+        self._nodata = None
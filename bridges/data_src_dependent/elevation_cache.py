@@ -0,0 +1,158 @@
+import hashlib
+import math
+import pickle
+
+import numpy as np
+
+from bridges.data_src_dependent.elevation import EleData
+
+
+class ElevationCache:
+    """Local multi-resolution store of the elevation grids downloaded so far.
+
+    Every grid received from the elevation server is kept as a tile, with
+    its extent and cell size recorded in a small index. A request for a
+    bounding box and resolution is answered by resampling the tiles that
+    are at least as fine as requested onto the requested grid; finer tiles
+    are downsampled and adjacent tiles are stitched together. Only the
+    parts of the request that no tile covers have to be downloaded, as a
+    few rectangles.
+
+    Tiles are stored through the lru_cache, so they share its eviction
+    policy with the other cached data sets.
+    """
+
+    index_file = "./bridges_data_cache/elevation_index"
+    nodata = -9999
+    # server grids are only approximately at the requested resolution
+    res_tolerance = 0.1
+    # a gap split in more pieces is downloaded as its bounding box
+    max_pieces = 16
+
+    def __init__(self, lru):
+        """
+        :param lru: lru_cache the tiles are stored in
+        """
+        self._lru = lru
+        self._index = []
+        try:
+            with open(ElevationCache.index_file, "rb") as fp:
+                self._index = pickle.load(fp)
+        except Exception:
+            pass
+        # drop the tiles the lru evicted since last time
+        self._index = [t for t in self._index if self._lru.inCache(t["key"])]
+
+    def _save_index(self):
+        with open(ElevationCache.index_file, "wb") as fp:
+            pickle.dump(self._index, fp)
+
+    def add(self, ele: EleData, bbox: list, res: float) -> None:
+        """Store a grid received from the server
+        :param ele: EleData, the grid
+        :param bbox: [minLat, minLon, maxLat, maxLon] that was requested
+        :param res: float, resolution that was requested
+        """
+        key = "ele_" + hashlib.md5(repr((list(bbox), res)).encode()).hexdigest()
+        self._lru.put(key, ele)
+        self._index = [t for t in self._index if t["key"] != key and self._lru.inCache(t["key"])]
+        self._index.append({
+            "key": key,
+            "request": (list(bbox), res),
+            "minLat": ele.yll,
+            "minLon": ele.xll,
+            "maxLat": ele.yll + ele.rows * ele.cellsize,
+            "maxLon": ele.xll + ele.cols * ele.cellsize,
+            "cellsize": ele.cellsize
+        })
+        self._save_index()
+
+    def lookup(self, bbox: list, res: float):
+        """Answer a request from the local tiles
+        :param bbox: [minLat, minLon, maxLat, maxLon]
+        :param res: float, requested resolution (in degrees)
+        :return: (EleData, missing) where missing is None if the request
+            was fully answered, else the list of [minLat, minLon, maxLat,
+            maxLon] boxes that still need to be downloaded (cells no tile
+            covers are set to nodata)
+        """
+        for t in self._index:
+            if t["request"] == (list(bbox), res):
+                return self._lru.get(t["key"]), None
+
+        min_lat, min_lon, max_lat, max_lon = [float(c) for c in bbox]
+        rows = max(1, int(math.ceil((max_lat - min_lat) / res - 1e-9)))
+        cols = max(1, int(math.ceil((max_lon - min_lon) / res - 1e-9)))
+        # cell centers of the requested grid, row 0 is the northernmost
+        lats = min_lat + (rows - 0.5 - np.arange(rows)) * res
+        lons = min_lon + (np.arange(cols) + 0.5) * res
+
+        data = np.full((rows, cols), ElevationCache.nodata, dtype=np.int32)
+        filled = np.zeros((rows, cols), dtype=bool)
+
+        candidates = [t for t in self._index
+                      if t["cellsize"] <= res * (1 + ElevationCache.res_tolerance)
+                      and t["minLat"] < max_lat and t["maxLat"] > min_lat
+                      and t["minLon"] < max_lon and t["maxLon"] > min_lon]
+        # coarsest first so that finer tiles overwrite them
+        candidates.sort(key=lambda t: -t["cellsize"])
+        for t in candidates:
+            tile = self._lru.get(t["key"])
+            tile_rows = tile.rows - 1 - np.floor((lats - tile.yll) / tile.cellsize).astype(np.int64)
+            tile_cols = np.floor((lons - tile.xll) / tile.cellsize).astype(np.int64)
+            row_in = (tile_rows >= 0) & (tile_rows < tile.rows)
+            col_in = (tile_cols >= 0) & (tile_cols < tile.cols)
+            if not row_in.any() or not col_in.any():
+                continue
+            sel = np.ix_(np.nonzero(row_in)[0], np.nonzero(col_in)[0])
+            values = tile.data[np.ix_(tile_rows[row_in], tile_cols[col_in])]
+            valid = tile.valid_mask()[np.ix_(tile_rows[row_in], tile_cols[col_in])]
+            data[sel] = np.where(valid, values, data[sel])
+            filled[sel] |= valid
+
+        ret_ele = EleData()
+        ret_ele.cols = cols
+        ret_ele.rows = rows
+        ret_ele.xll = min_lon
+        ret_ele.yll = min_lat
+        ret_ele.cellsize = res
+        ret_ele.data = data
+
+        if filled.all():
+            return ret_ele, None
+        ret_ele.nodata = ElevationCache.nodata
+        if not filled.any():
+            return ret_ele, [[min_lat, min_lon, max_lat, max_lon]]
+        return ret_ele, self._missing_boxes(~filled, [min_lat, min_lon, max_lat, max_lon], res)
+
+    def _missing_boxes(self, gap, bbox, res):
+        # split the cells no tile covers into rectangles: strips of rows
+        # missing the same columns, then the runs of missing columns of
+        # each strip
+        min_lat, min_lon, max_lat, max_lon = bbox
+        rows = gap.shape[0]
+
+        def box(top, bottom, left, right):
+            # rows top to bottom and columns left to right, excluded
+            return [float(min_lat + (rows - bottom) * res), float(min_lon + left * res),
+                    float(min(max_lat, min_lat + (rows - top) * res)), float(min(max_lon, min_lon + right * res))]
+
+        boxes = []
+        r = 0
+        while r < rows:
+            if not gap[r].any():
+                r += 1
+                continue
+            end = r + 1
+            while end < rows and np.array_equal(gap[end], gap[r]):
+                end += 1
+            steps = np.diff(np.concatenate(([0], gap[r].astype(np.int8), [0])))
+            for left, right in zip(np.nonzero(steps == 1)[0], np.nonzero(steps == -1)[0]):
+                boxes.append(box(r, end, int(left), int(right)))
+            r = end
+
+        if len(boxes) > ElevationCache.max_pieces:
+            missing_rows = np.nonzero(gap.any(axis=1))[0]
+            missing_cols = np.nonzero(gap.any(axis=0))[0]
+            return [box(missing_rows[0], missing_rows[-1] + 1, missing_cols[0], missing_cols[-1] + 1)]
+        return boxes
@@ -65,19 +65,42 @@ class OsmEdge:
     def distance(self):
         del self._distance
 
+    @property
+    def geometry(self) -> list:
+        """Shape of the road this edge stands for, as a list of OsmVertex
+        going from source to destination (endpoints included). None for
+        edges that are a single straight segment
+        :return: List[OsmVertex]
+        """
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, geometry: list):
+        if geometry is not None and not isinstance(geometry, list):
+            raise ValueError("geometry must be a list of OsmVertex objects")
+
+        self._geometry = geometry
+
+    @geometry.deleter
+    def geometry(self):
+        del self._geometry
+
 
-    def __init__(self, source: int, destination: int, distance: float):
+    def __init__(self, source: int, destination: int, distance: float, geometry: list = None):
         """OsmEdge, represents edge between two OsmVertex points
         :param source: int, ID of source vertex
         :param destination: ID of destination vertex
         :param distance: float, distance between the vertices
+        :param geometry: List[OsmVertex], optional shape of the edge
         """
         self._source = 0
         self._destination = 0
         self._distance = 0.0
+        self._geometry = None
         self.source = source
         self.destination = destination
         self.distance = distance
+        self.geometry = geometry
 
 
 class OsmVertex:
@@ -240,6 +263,105 @@ class OsmData:
 
         return ret_graph
 
+    def simplify(self, tolerance: float = None):
+        """Build a smaller copy of this data set where chains of
+        degree-2 shape vertices are contracted into single edges.
+
+        A vertex is contracted when it is connected to exactly two other
+        vertices and traffic simply flows through it (one-way or two-way).
+        The resulting edge carries the summed distance of the chain and
+        keeps the original shape in its geometry so it can still be drawn.
+        Intersections, dead ends and isolated loops are preserved, so
+        shortest paths between the remaining vertices are unchanged.
+
+        :param tolerance: float, optional Douglas-Peucker tolerance (in the
+            units of cartesian_coord, i.e. km) used to thin the geometry;
+            None keeps every shape vertex
+        :return: OsmData
+        """
+        n = len(self.vertices)
+        out_edges = [[] for _ in range(n)]
+        in_nbrs = [[] for _ in range(n)]
+        for edge in self.edges:
+            out_edges[edge.source].append(edge)
+            in_nbrs[edge.destination].append(edge.source)
+
+        # a vertex is a pure shape vertex if it touches exactly two other
+        # vertices and its edges either all go one way or come in pairs
+        interior = [False] * n
+        for v in range(n):
+            outs = [e.destination for e in out_edges[v]]
+            ins = in_nbrs[v]
+            nbrs = set(outs) | set(ins)
+            if len(nbrs) != 2 or v in nbrs:
+                continue
+            if len(outs) == 1 and len(ins) == 1 and outs[0] != ins[0]:
+                interior[v] = True
+            elif len(outs) == 2 and len(ins) == 2 and set(outs) == nbrs and set(ins) == nbrs:
+                interior[v] = True
+
+        new_index = [-1] * n
+        vertices = []
+
+        def keep(v):
+            new_index[v] = len(vertices)
+            vertices.append(self.vertices[v])
+
+        for v in range(n):
+            if not interior[v]:
+                keep(v)
+
+        visited = [False] * n
+        chains = []
+
+        def walk_from(u):
+            for first in out_edges[u]:
+                path = [u]
+                distance = first.distance
+                prev = u
+                cur = first.destination
+                while interior[cur] and new_index[cur] == -1:
+                    visited[cur] = True
+                    path.append(cur)
+                    nxt = None
+                    for e in out_edges[cur]:
+                        if e.destination != prev:
+                            nxt = e
+                            break
+                    distance += nxt.distance
+                    prev = cur
+                    cur = nxt.destination
+                path.append(cur)
+                chains.append((path, distance))
+
+        for v in range(n):
+            if new_index[v] != -1:
+                walk_from(v)
+
+        # loops made only of shape vertices get one of their vertices kept
+        for v in range(n):
+            if interior[v] and not visited[v] and new_index[v] == -1:
+                keep(v)
+                visited[v] = True
+                walk_from(v)
+
+        edges = []
+        for path, distance in chains:
+            geometry = None
+            if len(path) > 2:
+                shape = path
+                if tolerance is not None:
+                    shape = [path[i] for i in _douglas_peucker(
+                        [self.vertices[p].cartesian_coord for p in path], tolerance)]
+                geometry = [self.vertices[p] for p in shape]
+            edges.append(OsmEdge(new_index[path[0]], new_index[path[-1]], distance, geometry))
+
+        ret_osm = OsmData()
+        ret_osm.edges = edges
+        ret_osm.vertices = vertices
+        ret_osm.name = self.name
+        return ret_osm
+
     def __init__(self):
         self._vertices = []
         self._edges = []
@@ -248,3 +370,42 @@ class OsmData:
         self.cartesian_range_x = []
         self.cartesian_range_y = []
         self.name = None
+
+
+def _douglas_peucker(points: list, tolerance: float) -> list:
+    """Indices of the points kept by Douglas-Peucker simplification
+    of a polyline; the endpoints are always kept
+    :param points: list of [x, y] coordinates
+    :param tolerance: float, maximum distance of a dropped point to the line
+    :return: List[int]
+    """
+    if len(points) < 3:
+        return list(range(len(points)))
+
+    kept = [False] * len(points)
+    kept[0] = kept[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        x1, y1 = points[first]
+        x2, y2 = points[last]
+        dx = x2 - x1
+        dy = y2 - y1
+        seg_len = math.hypot(dx, dy)
+        max_dist = -1.0
+        max_index = first
+        for i in range(first + 1, last):
+            px, py = points[i]
+            if seg_len == 0:
+                dist = math.hypot(px - x1, py - y1)
+            else:
+                dist = abs(dy * px - dx * py + x2 * y1 - y2 * x1) / seg_len
+            if dist > max_dist:
+                max_dist = dist
+                max_index = i
+        if max_dist > tolerance:
+            kept[max_index] = True
+            stack.append((first, max_index))
+            stack.append((max_index, last))
+
+    return [i for i, k in enumerate(kept) if k]
@@ -136,10 +136,10 @@ class DLelement(SLelement):
             prv = par.prev
             if nxt is not None:
                 #  add the link
-                links_JSON.append(self.get_link_representation(par.get_link_visualizer(nxt), str(node_map.get(par)), str(node_map.get(nxt))))
+                links_JSON.append(self.get_link_representation(par.peek_link_visualizer(nxt), str(node_map.get(par)), str(node_map.get(nxt))))
             if prv is not None:
                 #  add the link
-                links_JSON.append(self.get_link_representation(par.get_link_visualizer(prv), str(node_map.get(par)), str(node_map.get(prv))))
+                links_JSON.append(self.get_link_representation(par.peek_link_visualizer(prv), str(node_map.get(par)), str(node_map.get(prv))))
             k += 1
         #  add the link
         json_dict = {
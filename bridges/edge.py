@@ -27,7 +27,8 @@ class Edge():
         self._from_vertex = v1
         self._to_vertex = v2
         self._edge_data = data
-        self._lvis = LinkVisualizer()
+        # allocated on first use, most edges are never styled
+        self._lvis = None
 
     @property
     def tov(self):
@@ -47,6 +48,17 @@ class Edge():
         """
         return self._from_vertex
 
+    @property
+    def link_visualizer(self) -> LinkVisualizer:
+        """
+        Getter for the link visualizer of this edge
+        Returns:
+            LinkVisualizer: visual attributes of this edge
+        """
+        if self._lvis is None:
+            self._lvis = LinkVisualizer()
+        return self._lvis
+
     @property
     def thickness(self) -> float:
         """
@@ -54,7 +66,7 @@ class Edge():
         Returns:
              float : link thickness (1.0-10.0 range)
         """
-        return self._lvis.thickness
+        return self.link_visualizer.thickness
 
     @thickness.setter
     def thickness(self, th: float) -> None:
@@ -65,7 +77,7 @@ class Edge():
         Returns:
             None
         """
-        self._lvis.thickness = th
+        self.link_visualizer.thickness = th
 
     @property
     def edge_data(self):
@@ -94,7 +106,7 @@ class Edge():
         Returns:
                 color of edge (see link visualizer class for setting options
         """
-        return self._lvis.color
+        return self.link_visualizer.color
 
     @color.setter
     def color(self, color):
@@ -105,7 +117,7 @@ class Edge():
         Returns:
             None
         """
-        self._lvis.color = color
+        self.link_visualizer.color = color
 
     def get_edge(self):
         """
@@ -28,6 +28,10 @@ import sys
 #  2017, 2018, 6/24/19
 #
 #
+# style of the links nobody customized, shared instead of one per link
+_default_link_visualizer = LinkVisualizer()
+
+
 class Element():
     ids = 0
 
@@ -124,6 +128,12 @@ class Element():
         Returns:
             None
         """
+        # whoever follows the location of this element now follows the new visualizer
+        listener = self._visualizer._location_listener
+        if listener is not None and vis is not self._visualizer:
+            self._visualizer._location_listener = None
+            vis._location_listener = listener
+            listener(self._visualizer.is_located(), vis.is_located())
         self._visualizer = vis
 
     def get_link_visualizer(self, el) -> LinkVisualizer:
@@ -143,16 +153,30 @@ class Element():
             self._link_visualizer[el] = LinkVisualizer()
             return self._link_visualizer[el]
 
+    def peek_link_visualizer(self, el) -> LinkVisualizer:
+        """
+        Getter for the link visualizer of the link to another element, for
+        internal use when generating the JSON; unlike get_link_visualizer()
+        nothing is allocated for links that were never customized, they
+        get a shared default visualizer that must not be modified
+        Args:
+            el: the element terminating the link
+        Returns:
+            LinkVisualizer: of this link
+        """
+        return self._link_visualizer.get(el, _default_link_visualizer)
+
     def set_link_visualizer(self, el) -> None:
         """
         Setter for the link visualizer of this element
         Args:
             (Element) el: the terminating element of this link;
-             creates a new link visualizer for this link
+             resets this link to the default link visualizer
         Returns:
             None
         """
-        self._link_visualizer[el] = LinkVisualizer()
+        # the default visualizer is created again when asked for
+        self._link_visualizer.pop(el, None)
 
     def remove_link_visualizer(self, el) -> None:
         """
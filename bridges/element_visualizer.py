@@ -56,6 +56,9 @@ class ElementVisualizer():
         self.prop["key"] = ""
         self.prop["locationX"] = Decimal("Infinity")
         self.prop["locationY"] = Decimal("Infinity")
+        # called with (was_located, is_located) when the location changes,
+        # lets a graph keep count of its located vertices
+        self._location_listener = None
 
 
     @property
@@ -153,10 +156,21 @@ class ElementVisualizer():
         Returns:
             None
         """
+        was_located = self.is_located()
         self.prop['locationX'] = x
         self.prop['locationY'] = y
         self._locationX = x
         self._locationY = y
+        if self._location_listener is not None:
+            self._location_listener(was_located, self.is_located())
+
+    def is_located(self) -> bool:
+        """
+        Whether the element has been given a location
+        Returns:
+            bool: True if both coordinates are finite
+        """
+        return self._locationX != float('inf') and self._locationY != float('inf')
 
     @property
     def location_x(self):
@@ -0,0 +1,281 @@
+import math
+import numpy as np
+from bridges.graph_csr import GraphCSR
+
+##
+#
+#    @brief Seeded generators of synthetic graphs
+#
+#    These build graphs of a chosen size quickly and reproducibly (the same
+#    seed gives the same graph), without network access, for instance as
+#    inputs of the graph benchmarks (see GraphBenchmark.generator). Edges
+#    are drawn as numpy arrays; graphs are returned as a GraphCSR, or as a
+#    GraphAdjList when adj_list is True. Loops and duplicate edges are
+#    removed, so graphs may have slightly fewer edges than asked for.
+#    Undirected graphs hold each edge in both directions, and their edge
+#    count is that of the directed edges.
+#
+#    - erdos_renyi(): uniformly random edges
+#    - barabasi_albert(): preferential attachment, with a power law degree
+#      distribution
+#    - rmat(): recursive matrix (Kronecker) graphs, skewed and clustered
+#      like social or web graphs
+#    - grid2d(): road network like grids, with locations and edge lengths
+#    - actor_movie(): bipartite graphs of movies and their cast, popular
+#      actors playing in many movies
+#
+#    \sa GraphCSR, GraphBenchmark
+#
+
+# kinds of graphs of with_edges()
+KINDS = ("erdos_renyi", "barabasi_albert", "rmat", "grid2d", "actor_movie")
+
+
+def graph_from_edges(n, srcs, dests, directed: bool = True, adj_list: bool = False, weights=None, keys=None,
+                     locations=None, values=None):
+    """
+    Build a graph from arrays of edges, dropping loops and duplicate edges
+    Args:
+        n: number of vertices
+        srcs: array of source vertex indices
+        dests: array of destination vertex indices
+        directed: if False, each edge is added in both directions
+        adj_list: return a GraphAdjList instead of a GraphCSR
+        weights: array of edge weights, or None
+        keys: vertex keys in index order, the indices if None
+        locations: (n x 2) array of vertex locations, or None (only used
+         for a GraphAdjList)
+        values: vertex data in index order, or None (only used for a
+         GraphAdjList)
+    Returns:
+        GraphCSR or GraphAdjList
+    """
+    srcs = np.asarray(srcs, dtype=np.int64)
+    dests = np.asarray(dests, dtype=np.int64)
+    if not directed:
+        srcs, dests = np.concatenate((srcs, dests)), np.concatenate((dests, srcs))
+        if weights is not None:
+            weights = np.concatenate((weights, weights))
+    # drop loops and duplicates, keeping the first occurrence
+    pairs = srcs * n + dests
+    _, first = np.unique(pairs, return_index=True)
+    first = first[srcs[first] != dests[first]]
+    srcs = srcs[first]
+    dests = dests[first]
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64)[first]
+    if not adj_list:
+        return GraphCSR.from_edges(n, srcs, dests, weights, keys)
+    return to_adj_list(GraphCSR.from_edges(n, srcs, dests, weights, keys), locations, values)
+
+
+def to_adj_list(csr: GraphCSR, locations=None, values=None, graph=None):
+    """
+    Build a GraphAdjList from a snapshot
+    Args:
+        csr: the snapshot
+        locations: (num_vertices x 2) array of vertex locations, or None
+        values: vertex data in index order, or None
+        graph: GraphAdjList to add the vertices and edges to, a new one if
+         None
+    Returns:
+        GraphAdjList: with the keys of the snapshot, and the edge weights
+        (if any) as edge data
+    """
+    from bridges.graph_adj_list import GraphAdjList
+    if graph is None:
+        graph = GraphAdjList()
+    keys = list(csr.keys)
+    graph.add_vertices(keys, values)
+    graph.add_edges([keys[i] for i in csr.sources().tolist()], [keys[i] for i in csr.targets.tolist()],
+                    None if csr.weights is None else csr.weights.tolist())
+    if locations is not None:
+        graph.set_locations(locations, keys)
+    return graph
+
+
+def erdos_renyi(num_vertices: int, num_edges: int, directed: bool = True, seed: int = None,
+                adj_list: bool = False):
+    """
+    Random graph with edges drawn uniformly (G(n, m) model)
+    Args:
+        num_vertices: number of vertices
+        num_edges: number of edges (pairs of vertices when undirected)
+        directed: whether the graph is directed
+        seed: random seed
+        adj_list: return a GraphAdjList instead of a GraphCSR
+    Returns:
+        GraphCSR or GraphAdjList
+    """
+    rng = np.random.default_rng(seed)
+    n = num_vertices
+    num_edges = min(num_edges, n * (n - 1) // (1 if directed else 2))
+    pairs = np.zeros(0, dtype=np.int64)
+    # draw a few more edges than needed, until there are enough distinct ones
+    while len(pairs) < num_edges:
+        draw = rng.integers(0, n, (int((num_edges - len(pairs)) * 1.1) + 16, 2))
+        if not directed:
+            draw.sort(axis=1)
+        draw = draw[draw[:, 0] != draw[:, 1]]
+        pairs = np.unique(np.concatenate((pairs, draw[:, 0] * n + draw[:, 1])))
+    pairs = rng.permutation(pairs)[:num_edges]
+    return graph_from_edges(n, pairs // n, pairs % n, directed, adj_list)
+
+
+def barabasi_albert(num_vertices: int, edges_per_vertex: int, seed: int = None, adj_list: bool = False):
+    """
+    Undirected preferential attachment graph: each new vertex is linked to
+    edges_per_vertex earlier vertices, chosen with a probability
+    proportional to their degree. Drawn as in Batagelj and Brandes:
+    picking the endpoint of a uniformly random earlier edge, resolved for
+    all edges at once.
+    Args:
+        num_vertices: number of vertices
+        edges_per_vertex: number of edges added with each vertex
+        seed: random seed
+        adj_list: return a GraphAdjList instead of a GraphCSR
+    Returns:
+        GraphCSR or GraphAdjList
+    """
+    rng = np.random.default_rng(seed)
+    m0 = max(1, edges_per_vertex)
+    n = max(num_vertices, m0 + 1)
+    # edge e links new vertex src[e] to the endpoint at slot pick[e] of the
+    # endpoint list (src[0], dest[0], src[1], dest[1], ...)
+    src = np.repeat(np.arange(m0, n), m0)
+    count = len(src)
+    slot = 2 * np.arange(count)
+    pick = (rng.random(count) * slot).astype(np.int64)
+    # the first vertex links to the m0 initial vertices, coded -1-vertex
+    pick[:m0] = -1 - np.arange(m0)
+    # a pick of an odd slot is the destination of an earlier edge: follow
+    # the picks until they reach a source slot or an initial vertex
+    while True:
+        odd = (pick >= 0) & (pick % 2 == 1)
+        if not odd.any():
+            break
+        pick[odd] = pick[pick[odd] // 2]
+    dest = np.where(pick >= 0, src[np.maximum(pick, 0) // 2], -1 - pick)
+    return graph_from_edges(n, src, dest, False, adj_list)
+
+
+def rmat(scale: int, edge_factor: int = 16, a: float = 0.57, b: float = 0.19, c: float = 0.19,
+         directed: bool = True, seed: int = None, adj_list: bool = False):
+    """
+    Recursive matrix (R-MAT) graph, as in the Graph500 benchmark: each edge
+    falls in a quadrant of the adjacency matrix with probabilities a, b, c
+    and 1-a-b-c, then recursively in a quadrant of that quadrant. Vertices
+    are randomly renumbered.
+    Args:
+        scale: the graph has 2^scale vertices
+        edge_factor: number of edges drawn per vertex
+        a, b, c: quadrant probabilities
+        directed: whether the graph is directed
+        seed: random seed
+        adj_list: return a GraphAdjList instead of a GraphCSR
+    Returns:
+        GraphCSR or GraphAdjList
+    """
+    rng = np.random.default_rng(seed)
+    n = 1 << scale
+    m = edge_factor * n
+    srcs = np.zeros(m, dtype=np.int64)
+    dests = np.zeros(m, dtype=np.int64)
+    for bit in range(scale):
+        r = rng.random(m)
+        src_bit = r >= a + b
+        dest_bit = ((r >= a) & (r < a + b)) | (r >= a + b + c)
+        srcs |= src_bit.astype(np.int64) << bit
+        dests |= dest_bit.astype(np.int64) << bit
+    perm = rng.permutation(n)
+    return graph_from_edges(n, perm[srcs], perm[dests], directed, adj_list)
+
+
+def grid2d(rows: int, cols: int, removal: float = 0.1, jitter: float = 0.3, seed: int = None,
+           adj_list: bool = False):
+    """
+    Road network like graph: a rows x cols grid, undirected, whose
+    vertices are moved randomly off their grid position and from which a
+    fraction of the edges is removed. Edge weights are their lengths.
+    Args:
+        rows: number of rows
+        cols: number of columns
+        removal: fraction of the edges removed
+        jitter: largest move of the vertices, in grid spacings
+        seed: random seed
+        adj_list: return a GraphAdjList instead of a GraphCSR; its vertices
+         are located (at column, row)
+    Returns:
+        GraphCSR or GraphAdjList
+    """
+    rng = np.random.default_rng(seed)
+    n = rows * cols
+    ids = np.arange(n).reshape(rows, cols)
+    srcs = np.concatenate((ids[:, :-1].ravel(), ids[:-1, :].ravel()))
+    dests = np.concatenate((ids[:, 1:].ravel(), ids[1:, :].ravel()))
+    keep = rng.random(len(srcs)) >= removal
+    srcs = srcs[keep]
+    dests = dests[keep]
+    locations = np.column_stack(((ids % cols).ravel(), (ids // cols).ravel())).astype(np.float64)
+    locations += rng.uniform(-jitter, jitter, (n, 2))
+    lengths = np.sqrt(((locations[srcs] - locations[dests]) ** 2).sum(axis=1))
+    return graph_from_edges(n, srcs, dests, False, adj_list, weights=lengths, locations=locations)
+
+
+def actor_movie(num_movies: int, num_actors: int, cast_size: int = 10, skew: float = 1.0,
+                seed: int = None, adj_list: bool = False):
+    """
+    Bipartite, undirected graph of movies and their cast, like the graphs
+    of GraphBenchmark built from Wikidata: vertices 0 to num_movies-1 are
+    movies ("movie_<i>"), the others are actors ("actor_<j>"). Each movie
+    has cast_size actors; the j-th actor is picked with a probability
+    proportional to 1/(j+1)^skew, so few actors play in many movies.
+    Args:
+        num_movies: number of movies
+        num_actors: number of actors
+        cast_size: number of actors per movie
+        skew: popularity skew of the actors, 0 for uniform
+        seed: random seed
+        adj_list: return a GraphAdjList instead of a GraphCSR
+    Returns:
+        GraphCSR or GraphAdjList
+    """
+    rng = np.random.default_rng(seed)
+    popularity = 1.0 / np.arange(1, num_actors + 1) ** skew
+    cumulative = np.cumsum(popularity)
+    movies = np.repeat(np.arange(num_movies), cast_size)
+    actors = np.searchsorted(cumulative, rng.random(len(movies)) * cumulative[-1], side="right")
+    actors = np.minimum(actors, num_actors - 1)
+    keys = ["movie_" + str(i) for i in range(num_movies)] + ["actor_" + str(j) for j in range(num_actors)]
+    return graph_from_edges(num_movies + num_actors, movies, num_movies + actors, False, adj_list, keys=keys)
+
+
+def with_edges(kind: str, num_edges: int, seed: int = None, adj_list: bool = True):
+    """
+    Graph of one of the kinds above with about num_edges (directed) edges,
+    with the parameters the benchmarks use
+    Args:
+        kind: "erdos_renyi", "barabasi_albert", "rmat", "grid2d" or
+         "actor_movie"
+        num_edges: about how many edges the graph should have
+        seed: random seed
+        adj_list: return a GraphAdjList instead of a GraphCSR
+    Returns:
+        GraphCSR or GraphAdjList
+    Raises:
+        ValueError: if the kind is unknown
+    """
+    if kind == "erdos_renyi":
+        return erdos_renyi(max(2, num_edges // 8), num_edges, seed=seed, adj_list=adj_list)
+    if kind == "barabasi_albert":
+        return barabasi_albert(max(2, num_edges // 8), 4, seed=seed, adj_list=adj_list)
+    if kind == "rmat":
+        scale = max(1, int(math.log2(max(num_edges, 32) / 16)))
+        return rmat(scale, max(1, round(num_edges / (1 << scale))), seed=seed, adj_list=adj_list)
+    if kind == "grid2d":
+        side = max(2, int(math.sqrt(num_edges / 3.6)))
+        return grid2d(side, side, seed=seed, adj_list=adj_list)
+    if kind == "actor_movie":
+        movies = max(1, num_edges // 20)
+        return actor_movie(movies, 4 * movies, seed=seed, adj_list=adj_list)
+    raise ValueError("Unknown kind of graph " + str(kind))
@@ -1,6 +1,17 @@
 #!/usr/bin/env python
 from bridges.sl_element import *
 from bridges.edge import *
+from bridges.element import _default_link_visualizer
+from bridges.graph_csr import GraphCSR
+from bridges.subgraph_view import SubgraphView
+from bridges import graph_encoding
+from bridges import graph_file
+import collections.abc
+import heapq
+import json
+import multiprocessing
+import numpy as np
+import os
 import traceback
 
 
@@ -21,11 +32,13 @@ import traceback
 #    The vertices of the graph are held in a Java hashmap, for near constant time access;
 #    this lets us use strings or integral ids for vertices. The adjacency lists,
 #    also a Java hashmap  are built for each vertex and contain the edge (terminating
-#    vertex id, weight) in the Edge structure, defined separately. Adjacency lists
-#    are singly linked lists using the BRIDGES SLelement.
+#    vertex id, weight) in the Edge structure, defined separately. Each adjacency
+#    list is stored as a dictionary from destination vertex to Edge, so edges are
+#    found in constant time; get_adjacency_list() presents it as a singly linked
+#    list (value/next) for compatibility with code written against SLelement chains.
 #
-#    Convenience methods are provided to add vertices and edges to the graph as well as
-#    retrieve the adjacency list of a vertex, given its id.
+#    Convenience methods are provided to add (and remove) vertices and edges to the graph
+#    as well as retrieve the adjacency list of a vertex, given its id.
 #
 #   @author Matthew Mcquaigue
 #    @date 2018,  7/23/19
@@ -34,6 +47,8 @@ import traceback
 #
 class GraphAdjList:
     LargeGraphVertSize = 1000
+    # smaller graphs are not worth starting worker processes for
+    ParallelMinEdges = 100000
     force_large_viz = False
     force_small_viz = False
 
@@ -44,7 +59,32 @@ class GraphAdjList:
             None
         """
         self._vertices = dict()
-        self.adj_list = dict()
+        self._adj = dict()
+        # number of edges, kept up to date as edges are added (the out
+        # degree of a vertex is the size of its adjacency dict)
+        self._edge_count = 0
+        # sources of the edges reaching each vertex; built by the first
+        # removal, then kept up to date, see remove_vertex()
+        self._radj = None
+        # bumped on every change, tells whether the frozen snapshot is current
+        self._version = 0
+        self._csr = None
+        self._csr_version = -1
+        # number of vertices with a location, kept up to date by their visualizers
+        self._located_count = 0
+        self._large_graph_encoding = "json"
+        # dense index of each vertex key, in order of insertion, and the
+        # keys by index; used to number nodes in the JSON and the snapshots
+        self._key_index = dict()
+        self._keys = []
+        # link styles set through the graph, keyed by (src index, dest index)
+        self._link_styles = dict()
+        # level of detail of the visualization, see set_level_of_detail()
+        self._lod = None
+        self._lod_view = None
+        self._lod_version = -1
+        # number of processes building the JSON, see set_parallel_serialization()
+        self._processes = 1
 
     def get_data_structure_type(self) -> str:
         """
@@ -52,12 +92,25 @@ class GraphAdjList:
         Returns:
             str: representing the type
         """
-        if (GraphAdjList.force_large_viz == True or (GraphAdjList.force_small_viz == False and
-                                                     self.LargeGraphVertSize < len(self.vertices) and
-                                                     self.are_all_vertices_located())):
+        if self._use_large_graph():
             return "largegraph"
         return "GraphAdjacencyList"
 
+    def _use_large_graph(self) -> bool:
+        if self._lod is not None and self._lod["mode"] == "grid":
+            return True
+        return self._use_large_graph_view(self._visible())
+
+    def _use_large_graph_view(self, view) -> bool:
+        if view is None:
+            count = len(self.vertices)
+            located = self.are_all_vertices_located()
+        else:
+            count = len(view[0])
+            located = all(self._vertices[self._keys[i]].visualizer.is_located() for i in view[0].tolist())
+        return (GraphAdjList.force_large_viz == True or (GraphAdjList.force_small_viz == False and
+                                                         self.LargeGraphVertSize < count and located))
+
     def add_vertex(self, k, e) -> None:
         """
         Adds a new vertex to the graph, initializes the adjacency
@@ -71,16 +124,27 @@ class GraphAdjList:
         """
         #  note: it is the user's responsibility to  check
         #  for duplicate vertices
+        self._forget_location(self.vertices.get(k))
+        if k not in self._key_index:
+            self._key_index[k] = len(self._keys)
+            self._keys.append(k)
+        else:
+            self._forget_link_styles(k)
         self.vertices[k] = Element(val=e)
         self.vertices.get(k).label = str(k)
-        self.adj_list[k] = None
+        self.vertices.get(k).visualizer._location_listener = self._location_changed
+        self._edge_count -= len(self._adj.get(k, ()))
+        if self._radj is not None:
+            self._forget_sources(k)
+        self._adj[k] = dict()
+        self._version += 1
 
     def add_edge(self, src, dest, data=None) -> None:
         """
         Adds a new edge to the graph, adds it to that vertex's
         adjacency list; user is responsible for checking if the
-        vertex already exists. This version assumes a default edge
-        weight of 1.
+        vertex already exists. Adding an edge that already exists
+        replaces its data.
         Args:
             src: source vertex of edge
             dest: destination  vertex of edge
@@ -96,7 +160,196 @@ class GraphAdjList:
                                  " does not exist! Add the vertex before creating the edge.")
         except Exception as e:
             traceback.print_tb(e.__traceback__)
-        self.adj_list[src] = SLelement(e=Edge(src, dest, data), next=self.adj_list.get(src))
+        edges = self._adj[src]
+        if dest not in edges:
+            self._edge_count += 1
+            if self._radj is not None:
+                self._radj[dest].add(src)
+        edges[dest] = Edge(src, dest, data)
+        self._version += 1
+
+    def add_vertices(self, keys, values=None) -> None:
+        """
+        Adds many vertices at once, as add_vertex() does for each of them
+        Args:
+            keys: iterable (or numpy array) of vertex ids
+            values: iterable of the vertex data, in the order of keys;
+             None to leave the data of all vertices empty
+        Returns:
+            None
+        Raises:
+            ValueError: if keys and values do not have the same length
+        """
+        keys = _as_list(keys)
+        values = [None] * len(keys) if values is None else _as_list(values)
+        if len(keys) != len(values):
+            raise ValueError("add_vertices: " + str(len(keys)) + " keys but " + str(len(values)) + " values")
+        key_index = self._key_index
+        for k in keys:
+            self._forget_location(self.vertices.get(k))
+            if k not in key_index:
+                key_index[k] = len(self._keys)
+                self._keys.append(k)
+            else:
+                self._forget_link_styles(k)
+        new_vertices = {k: Element(val=e, label=str(k)) for k, e in zip(keys, values)}
+        for el in new_vertices.values():
+            el.visualizer._location_listener = self._location_changed
+        self.vertices.update(new_vertices)
+        self._edge_count -= sum(len(self._adj.get(k, ())) for k in new_vertices)
+        if self._radj is not None:
+            for k in new_vertices:
+                self._forget_sources(k)
+        self._adj.update((k, dict()) for k in new_vertices)
+        self._version += 1
+
+    def add_edges(self, srcs, dests, data=None) -> None:
+        """
+        Adds many edges at once, as add_edge() does for each of them. All
+        endpoints are checked before any edge is added.
+        Args:
+            srcs: iterable (or numpy array) of source vertices
+            dests: iterable of destination vertices, in the order of srcs
+            data: iterable of edge data in the order of srcs, or a single
+             value given to every edge (None by default)
+        Returns:
+            None
+        Raises:
+            ValueError: if the iterables have different lengths or if some
+             endpoints are not vertices of the graph (all of them are listed)
+        """
+        srcs = _as_list(srcs)
+        dests = _as_list(dests)
+        if data is None or isinstance(data, (str, int, float)):
+            data = [data] * len(srcs)
+        else:
+            data = _as_list(data)
+        if len(srcs) != len(dests) or len(srcs) != len(data):
+            raise ValueError("add_edges: srcs, dests and data must have the same length")
+
+        vertices = self.vertices
+        missing = [v for v in set(srcs).union(dests) if v not in vertices]
+        if missing:
+            raise ValueError("Vertices " + ", ".join(str(v) for v in missing) +
+                             " do not exist! Add the vertices before creating the edges.")
+
+        adj = self._adj
+        sources = set(srcs)
+        self._edge_count -= sum(len(adj[src]) for src in sources)
+        for src, dest, d in zip(srcs, dests, data):
+            adj[src][dest] = Edge(src, dest, d)
+        if self._radj is not None:
+            radj = self._radj
+            for src, dest in zip(srcs, dests):
+                radj[dest].add(src)
+        self._edge_count += sum(len(adj[src]) for src in sources)
+        self._version += 1
+
+    def _forget_link_styles(self, k) -> None:
+        # a vertex (re)added with no outgoing edges: drop the styles of its
+        # former links
+        if self._link_styles:
+            key_index = self._key_index
+            i = key_index[k]
+            for dest in self._adj.get(k, ()):
+                self._link_styles.pop((i, key_index[dest]), None)
+
+    def _forget_sources(self, k) -> None:
+        # a vertex (re)added with no outgoing edges: drop it from the sources
+        # of its former destinations
+        radj = self._radj
+        for dest in self._adj.get(k, ()):
+            radj[dest].discard(k)
+        radj.setdefault(k, set())
+
+    def _reverse_adjacency(self) -> dict:
+        if self._radj is None:
+            radj = {k: set() for k in self._adj}
+            for src, edges in self._adj.items():
+                for dest in edges:
+                    radj[dest].add(src)
+            self._radj = radj
+        return self._radj
+
+    def remove_edge(self, src, dest) -> None:
+        """
+        Removes an edge from the graph, with its link style
+        Args:
+            src: source vertex of the edge
+            dest: destination vertex of the edge
+        Returns:
+            None
+        Raises:
+            ValueError: if the edge does not exist
+        """
+        edges = self._adj.get(src)
+        if edges is None or dest not in edges:
+            raise ValueError("Edge from " + str(src) + " to " + str(dest) + " does not exist!")
+        del edges[dest]
+        if self._radj is not None:
+            self._radj[dest].discard(src)
+        self._edge_count -= 1
+        self._link_styles.pop((self._key_index[src], self._key_index[dest]), None)
+        self.vertices[src]._link_visualizer.pop(self.vertices[dest], None)
+        self._version += 1
+
+    def remove_vertex(self, k) -> None:
+        """
+        Removes a vertex from the graph, with the edges leaving and reaching
+        it and their link styles. The first removal builds an index of the
+        edges reaching each vertex (linear time), which is then kept up to
+        date, so that removing a vertex takes time proportional to its
+        degree. The last vertex of key_set() takes the place (index) of the
+        removed one.
+        Args:
+            k: the vertex key
+        Returns:
+            None
+        Raises:
+            ValueError: if the vertex does not exist
+        """
+        el = self.vertices.get(k)
+        if el is None:
+            raise ValueError("Vertex " + str(k) + " does not exist!")
+        radj = self._reverse_adjacency()
+        adj = self._adj
+        key_index = self._key_index
+        styles = self._link_styles
+        i = key_index[k]
+
+        for dest in adj[k]:
+            if dest != k:
+                radj[dest].discard(k)
+            styles.pop((i, key_index[dest]), None)
+        for src in radj[k]:
+            if src != k:
+                del adj[src][k]
+                self._edge_count -= 1
+                styles.pop((key_index[src], i), None)
+                self.vertices[src]._link_visualizer.pop(el, None)
+        self._edge_count -= len(adj[k])
+        self._forget_location(el)
+        del self.vertices[k], adj[k], radj[k]
+
+        # the last vertex takes the index of the removed one; only the
+        # styles of its edges need new keys
+        del key_index[k]
+        last = self._keys.pop()
+        if last != k:
+            old = len(self._keys)
+            self._keys[i] = last
+            key_index[last] = i
+            if styles:
+                moved = [((old, old), (i, i))] if last in adj[last] else []
+                moved += [((old, key_index[dest]), (i, key_index[dest])) for dest in adj[last] if dest != last]
+                moved += [((key_index[src], old), (key_index[src], i)) for src in radj[last] if src != last]
+                for before, after in moved:
+                    if before in styles:
+                        styles[after] = styles.pop(before)
+
+        if self._lod is not None and self._lod["mode"] == "neighborhood":
+            self._lod["roots"] = [r for r in self._lod["roots"] if r != k]
+        self._version += 1
 
     def set_vertex_data(self, src, vertex_data) -> None:
         """
@@ -130,18 +383,15 @@ class GraphAdjList:
                 raise ValueError("Vertex " + src + " or " + dest + " does not exist!")
         except Exception as e:
             traceback.print_tb(e.__traceback__)
-        sle = self.adj_list[src]
-        while sle is not None:
-            edge_dest = sle.value.tov
-            if edge_dest == dest:
-                if edge_data is not None:
-                    sle.value.set_edge_data(edge_data)
-                    return
-                else:
-                    return sle.value.edge_data
-            sle = sle.next
-        if sle is None:
-            raise ValueError("VEdge from " + src + " to " + dest + "does not exist!")
+        edge = self._adj[src].get(dest)
+        if edge is None:
+            raise ValueError("VEdge from " + str(src) + " to " + str(dest) + "does not exist!")
+        if edge_data is not None:
+            edge.edge_data = edge_data
+            self._version += 1
+            return
+        else:
+            return edge.edge_data
 
     @property
     def vertices(self) -> dict:
@@ -162,43 +412,340 @@ class GraphAdjList:
         """
         return self.vertices.get(key)
 
+    @property
+    def adj_list(self) -> dict:
+        """
+        Getter for the adjacency lists of all vertices
+        Returns:
+            dict like view: vertex key to the head of its adjacency list
+            (None if empty), built when looked up; assigning the head of a
+            list of Edges to a vertex replaces its outgoing edges
+        """
+        return _AdjListView(self)
+
+    def _set_out_edges(self, k, head) -> None:
+        # replace the outgoing edges of a vertex by those of a linked list
+        if k not in self.vertices:
+            raise ValueError("Vertex " + str(k) + " does not exist! First add the vertex to the graph.")
+        edges = dict()
+        node = head
+        while node is not None:
+            edges[node.value.tov] = node.value
+            node = node.next
+        missing = [dest for dest in edges if dest not in self.vertices]
+        if missing:
+            raise ValueError("Vertices " + ", ".join(str(v) for v in missing) +
+                             " do not exist! Add the vertices before creating the edges.")
+        self._forget_link_styles(k)
+        self._edge_count += len(edges) - len(self._adj[k])
+        if self._radj is not None:
+            self._forget_sources(k)
+            for dest in edges:
+                self._radj[dest].add(k)
+        self._adj[k] = edges
+        self._version += 1
+
     def get_adjacency_list(self, vertex=None):
         """
         Gets the adjacency list
         Args:
             vertex: input  vertex 
         Returns:
-            list : adjacency list of this vertex
+            list : adjacency list of this vertex, a linked list of nodes
+            whose value is an Edge (None if the vertex has no edges)
         """
         if vertex is not None:
-            return self.adj_list.get(vertex)
+            edges = self._adj.get(vertex)
+            if edges is None:
+                return None
+            return _EdgeListNode.head(list(edges.values()))
         else:
             return self.adj_list
 
     def key_set(self):
-        return self.vertices.keys()
+        """
+        The vertex keys, in vertex index order: the order the vertices were
+        added in, the order of freeze().keys, of the nodes of the JSON, and
+        of the arrays of set_locations() and layout. After remove_vertex(),
+        the last vertex takes the place of the removed one.
+        Returns:
+            set like view of the keys
+        """
+        return _KeySet(self)
 
     def value_set(self):
-        return self.vertices.values()
+        """
+        The vertex elements, in the order of key_set()
+        Returns:
+            view of the elements
+        """
+        return _ValueSet(self)
 
     def out_going_edge_set_of(self, k):
-        return SLelement.list_helper(start=self.get_adjacency_list(k))
+        return self._adj[k].values()
 
     def get_edge_data(self, src, dest):
-        sle = self.adj_list[src]
-        while sle is not None:
-            ed = sle.value
-            if ed.get_vertex() == dest:
-                return ed.get_edge_data()
-            sle = sle.next
+        edge = self._adj[src].get(dest)
+        if edge is not None:
+            return edge.edge_data
+
+    def degree(self, k) -> int:
+        """
+        Out degree of a vertex, in constant time
+        Args:
+            k: the vertex key
+        Returns:
+            int: number of edges leaving the vertex
+        Raises:
+            KeyError: if the vertex does not exist
+        """
+        if "_file" in self.__dict__:
+            # not built yet, the snapshot read from the file knows
+            i = self._csr.index_of(k)
+            return int(self._csr.offsets[i + 1] - self._csr.offsets[i])
+        return len(self._adj[k])
+
+    def edge_count(self) -> int:
+        """
+        Number of edges of the graph, in constant time
+        Returns:
+            int
+        """
+        return self._edge_count
+
+    def top_k_by_degree(self, k: int) -> list:
+        """
+        The vertices of highest out degree, found with a heap of size k in
+        one pass over the vertices
+        Args:
+            k: number of vertices wanted
+        Returns:
+            list: keys of the (at most) k vertices of highest out degree, by
+            decreasing degree; ties are kept in key_set() order
+        """
+        if "_file" in self.__dict__:
+            csr = self._csr
+            degrees = csr.out_degrees.tolist()
+            return [csr.key_of(i) for i in heapq.nlargest(k, range(len(degrees)), key=degrees.__getitem__)]
+        adj = self._adj
+        return heapq.nlargest(k, self._keys, key=lambda v: len(adj[v]))
+
+    def freeze(self) -> GraphCSR:
+        """
+        Get an immutable compressed sparse row snapshot of the graph, for
+        fast traversal by graph algorithms. The snapshot is cached and
+        only rebuilt after the graph changed through its methods (changing
+        an Edge object directly is not noticed).
+        Returns:
+            GraphCSR: snapshot of the current graph
+        """
+        if self._csr is None or self._csr_version != self._version:
+            self._csr = GraphCSR.from_adjacency(self._keys, self._key_index, self._adj)
+            self._csr_version = self._version
+        return self._csr
+
+    def subgraph(self, vertices=None, edge_filter=None) -> SubgraphView:
+        """
+        Get a view of part of the graph, which can be passed to algorithms
+        or visualized without copying the vertices and edges (see
+        SubgraphView)
+        Args:
+            vertices: the vertex keys in the view, or a boolean numpy array
+             in key_set() order; None for all the vertices
+            edge_filter: function called with each Edge between vertices of
+             the view, returning whether it is in the view; None to keep all
+             of them
+        Returns:
+            SubgraphView: the view
+        Raises:
+            ValueError: if some of the vertices do not exist (all are listed)
+        """
+        return SubgraphView(self, vertices, edge_filter)
+
+    def save(self, path: str) -> None:
+        """
+        Save the graph in a binary file (see graph_file), to be loaded
+        again with GraphAdjList.load(). The vertex keys, the vertex data,
+        the edges with their data and the locations of the vertices are
+        saved; other visual properties are not. Vertex data is saved as
+        JSON when it comes back unchanged from JSON, else pickled. Int edge
+        data is read back as int, but only exactly below 2^53 (it is held
+        as float64, see graph_file).
+        Args:
+            path: file to write
+        Returns:
+            None
+        Raises:
+            ValueError: if the vertex keys are not all int or all str, or
+             some edge data is neither a number nor None
+        """
+        csr = self.freeze()
+        # in the order of the snapshot: by vertex index, then adjacency order
+        data = [edge.edge_data for k in self._keys for edge in self._adj[k].values()]
+        weights = None
+        int_weights = False
+        if any(d is not None for d in data):
+            if not all(d is None or (isinstance(d, (int, float)) and not isinstance(d, bool)) for d in data):
+                raise ValueError("Only graphs whose edge data are numbers (or None) can be saved")
+            weights = np.array([np.nan if d is None else d for d in data], dtype=np.float64)
+            int_weights = all(d is None or isinstance(d, int) for d in data)
+        locations = None
+        if self._located_count > 0:
+            locations = np.full((len(self._keys), 2), np.nan)
+            for i, k in enumerate(self._keys):
+                elvis = self._vertices[k].visualizer
+                if elvis.is_located():
+                    locations[i] = (float(elvis.location_x), float(elvis.location_y))
+        values = [self._vertices[k].value for k in self._keys]
+        if all(v is None for v in values):
+            values = None
+        graph_file.write_graph(path, self._keys, csr.offsets, csr.targets, weights, locations, values, int_weights)
+
+    @staticmethod
+    def load(path: str, mmap: bool = True) -> "GraphAdjList":
+        """
+        Load a graph saved by save(). With mmap, the file is memory mapped
+        and loading is almost immediate: freeze() returns a snapshot whose
+        arrays are views of the file, so algorithms working on snapshots
+        (see algorithms) run without building the graph, and processes
+        loading the same file share its pages. The vertices and edges are
+        only built the first time they are needed.
+        Args:
+            path: file to read
+            mmap: whether to memory map the file rather than read it all
+        Returns:
+            GraphAdjList: the graph
+        Raises:
+            ValueError: if the file is not a graph file
+        """
+        content = graph_file.read_graph(path, mmap)
+        graph = GraphAdjList()
+        # built from the file when first used, see __getattr__()
+        del graph._vertices, graph._adj, graph._keys, graph._key_index
+        graph._file = content
+        graph._edge_count = len(content.targets)
+        weights = content.weights
+        if weights is not None:
+            weights = np.where(np.isnan(weights), 1.0, weights)
+            if (weights == 1.0).all():
+                weights = None
+        graph._csr = GraphCSR(content.keys, content.offsets, content.targets, weights)
+        graph._csr_version = graph._version
+        return graph
+
+    @staticmethod
+    def from_edge_list(path: str, delimiter: str = None, weighted: bool = False, directed: bool = True,
+                       progress: bool = None) -> "GraphAdjList":
+        """
+        Build a graph from an edge list file (whitespace or CSV separated,
+        SNAP style), one edge per line: source and destination vertex ids,
+        and the weight of the edge if weighted. Lines starting with # or %
+        are comments. The file is read in chunks and parsed with numpy,
+        see graph_file.read_edge_list().
+        Args:
+            path: file to read
+            delimiter: field separator, None for any whitespace (use ","
+             for CSV files)
+            weighted: whether the third field is the edge weight (stored as
+             edge data)
+            directed: if False, each line adds the edge in both directions
+            progress: whether to print the progress of the reading, None to
+             print it for files larger than 256 MB
+        Returns:
+            GraphAdjList: the graph; vertex keys are int when all ids in the
+            file are integers, else str
+        Raises:
+            ValueError: if a line does not hold enough fields
+        """
+        keys, srcs, dests, weights = graph_file.read_edge_list(path, delimiter, weighted, progress)
+        if not directed:
+            srcs, dests = np.concatenate((srcs, dests)), np.concatenate((dests, srcs))
+            if weights is not None:
+                weights = np.concatenate((weights, weights))
+        graph = GraphAdjList()
+        graph.add_vertices(keys)
+        graph.add_edges([keys[i] for i in srcs.tolist()], [keys[i] for i in dests.tolist()],
+                        None if weights is None else weights.tolist())
+        return graph
+
+    def __getattr__(self, name):
+        # only called for missing attributes: the vertices and edges of a
+        # graph loaded from a file, which are built on first use
+        if name in ("_vertices", "_adj", "_keys", "_key_index") and "_file" in self.__dict__:
+            self._build_from_file()
+            return getattr(self, name)
+        raise AttributeError("'GraphAdjList' object has no attribute '" + name + "'")
+
+    def _build_from_file(self) -> None:
+        content = self.__dict__.pop("_file")
+        csr = self._csr
+        self._vertices = dict()
+        self._adj = dict()
+        self._keys = []
+        self._key_index = dict()
+        self._edge_count = 0
+        keys = list(content.keys)
+        self.add_vertices(keys, None if content.values is None else list(content.values))
+        srcs = [keys[i] for i in csr.sources().tolist()]
+        dests = [keys[i] for i in content.targets.tolist()]
+        if content.weights is None:
+            self.add_edges(srcs, dests)
+        else:
+            cast = int if content.int_weights else float
+            self.add_edges(srcs, dests, [None if w != w else cast(w) for w in content.weights.tolist()])
+        if content.locations is not None:
+            located = np.nonzero(~np.isnan(content.locations[:, 0]))[0]
+            self.set_locations(content.locations[located].tolist(), [keys[i] for i in located.tolist()])
+        # the snapshot read from the file still describes the graph
+        self._csr = csr
+        self._csr_version = self._version
+
+    def _location_changed(self, was_located, is_located):
+        self._located_count += int(is_located) - int(was_located)
+
+    def _forget_location(self, el):
+        # stop following the location of a vertex element leaving the graph
+        if el is not None and el.visualizer._location_listener is not None:
+            el.visualizer._location_listener = None
+            if el.visualizer.is_located():
+                self._located_count -= 1
 
     def are_all_vertices_located(self):
-        for element in self.vertices.items():
-            el = element[1]
-            elvis = el.visualizer
-            if(elvis.location_x == float('inf') or elvis.location_y == float('inf')):
-                return False
-        return True
+        """
+        Whether every vertex has a location; constant time, the graph keeps
+        count of the vertices that are located
+        Returns:
+            bool
+        """
+        # count the vertices first: that builds a graph loaded from a file,
+        # locating its vertices
+        count = len(self.vertices)
+        return self._located_count == count
+
+    def set_locations(self, locations, keys=None) -> None:
+        """
+        Set the location of many vertices at once, for instance from
+        layout.force_directed_layout()
+        Args:
+            locations: sequence (or n x 2 array) of x, y locations
+            keys: the vertices to locate, in the order of locations; all the
+             vertices in the order of key_set() if None
+        Returns:
+            None
+        Raises:
+            ValueError: if some of the vertices do not exist (all are listed),
+             or if there are not as many locations as vertices
+        """
+        keys = self._keys if keys is None else _as_list(keys)
+        missing = [k for k in keys if k not in self._vertices]
+        if missing:
+            raise ValueError("Vertices " + ", ".join(str(k) for k in missing) +
+                             " do not exist! First add the vertices to the graph.")
+        locations = _as_list(locations)
+        if len(locations) != len(keys):
+            raise ValueError("Got " + str(len(locations)) + " locations for " + str(len(keys)) + " vertices")
+        for k, (x, y) in zip(keys, locations):
+            self._vertices[k].visualizer.set_location(x, y)
 
     def force_large_visualization(self, f):
         if f:
@@ -215,6 +762,49 @@ class GraphAdjList:
             GraphAdjList.force_small_viz = False
 
 
+    def set_large_graph_encoding(self, encoding: str) -> None:
+        """
+        Choose how the node and link arrays of the largegraph representation
+        are encoded
+        Args:
+            encoding: "json" for nested lists of numbers, or "binary" for
+             base64 packed typed arrays (see graph_encoding), several times
+             smaller for big graphs
+        Returns:
+            None
+        Raises:
+            ValueError: if the encoding is not one of these
+        """
+        if encoding not in ("json", "binary"):
+            raise ValueError("Large graph encoding must be \"json\" or \"binary\"")
+        self._large_graph_encoding = encoding
+
+    def set_parallel_serialization(self, processes: int = None) -> None:
+        """
+        Build the JSON representation of big graphs (more than
+        ParallelMinEdges edges) in several processes. The vertices are split
+        in ranges holding about as many edges, each worker process turns
+        its ranges into JSON text, reading the graph and its snapshot (see
+        freeze()) from the memory it shares with this process, and the
+        texts are joined without being parsed again.
+        The representation then holds graph_encoding.RawJSON fragments,
+        which Bridges.visualize() handles. This needs processes to be
+        started by forking (Linux); elsewhere the JSON is built in this
+        process. Level of detail views and the binary encoding are always
+        built in this process.
+        Args:
+            processes: number of processes; None for one per core, 1 to build
+             the JSON in this process only (the default)
+        Returns:
+            None
+        """
+        self._processes = os.cpu_count() if processes is None else max(1, processes)
+
+    def _parallel(self) -> bool:
+        return (self._processes > 1 and self._visible() is None and
+                self._edge_count >= GraphAdjList.ParallelMinEdges and
+                "fork" in multiprocessing.get_all_start_methods())
+
     ##
     #
     #     This is a convenience method to simplify access to the link visualizer;
@@ -235,7 +825,63 @@ class GraphAdjList:
                     "Vertex " + src + " or " + dest + " does not exist! First add the vertices to the graph.")
         except Exception as e:
             traceback.print_tb(e.__traceback__)
-        return v1.get_link_visualizer(v2)
+        link = (self._key_index[src], self._key_index[dest])
+        lv = self._link_styles.get(link)
+        if lv is None:
+            # adopt a style set on the element itself, if any
+            lv = v1._link_visualizer.get(v2) or LinkVisualizer()
+            self._link_styles[link] = lv
+        # the element shares the style, so that styling the link through
+        # Element.get_link_visualizer() changes the same visualizer
+        v1._link_visualizer[v2] = lv
+        return lv
+
+    def _styled_links(self, edges) -> list:
+        edges = list(edges)
+        missing = [v for v in set(v for edge in edges for v in edge) if v not in self._key_index]
+        if missing:
+            raise ValueError("Vertices " + ", ".join(str(v) for v in missing) +
+                             " do not exist! First add the vertices to the graph.")
+        return [self.get_link_visualizer(src, dest) for src, dest in edges]
+
+    def set_links_color(self, edges, color) -> None:
+        """
+        Set the color of many links at once, for instance all the edges of a
+        shortest path tree: [(parent[v], v) for v in parent]
+        Args:
+            edges: iterable of (src, dest) vertex pairs
+            color: color name or Color to give to these links
+        Returns:
+            None
+        Raises:
+            ValueError: if some of the vertices do not exist (all are listed)
+        """
+        for lv in self._styled_links(edges):
+            lv.color = color
+
+    def set_links_thickness(self, edges, thickness: float) -> None:
+        """
+        Set the thickness of many links at once
+        Args:
+            edges: iterable of (src, dest) vertex pairs
+            thickness: thickness to give to these links
+        Returns:
+            None
+        Raises:
+            ValueError: if some of the vertices do not exist (all are listed)
+        """
+        for lv in self._styled_links(edges):
+            lv.thickness = thickness
+
+    def _peek_link_visualizer(self, src_indx, dest_indx, src_vert, dest) -> LinkVisualizer:
+        # style of a link for the JSON, see Element.peek_link_visualizer()
+        if self._link_styles:
+            lv = self._link_styles.get((src_indx, dest_indx))
+            if lv is not None:
+                return lv
+        if src_vert._link_visualizer:
+            return src_vert.peek_link_visualizer(self.vertices[dest])
+        return _default_link_visualizer
 
     ##
     #
@@ -256,49 +902,154 @@ class GraphAdjList:
             traceback.print_tb(e.__traceback__)
         return v.visualizer
 
+    def set_level_of_detail(self, mode: str = None, max_vertices: int = 5000, max_edges: int = 20000,
+                            roots=None, hops: int = 1, cells: int = 100, seed: int = None) -> None:
+        """
+        Visualize only part of the graph, or a summary of it, to keep the
+        visualization of very large graphs small. The part shown is chosen
+        from the snapshot of the graph (see freeze()), the graph itself is
+        not copied. Set the level of detail before handing the graph to
+        Bridges.set_data_structure().
+        Args:
+            mode: one of
+             None: show the whole graph (the default)
+             "vertices": sample max_vertices vertices, with a probability
+              growing with their degree, and show the edges between them
+             "neighborhood": show the vertices at most hops edges (in
+              either direction) away from the roots, and the edges
+              between them
+             "edges": sample max_edges edges, and show them with their
+              endpoints
+             "grid": aggregate the located vertices in a grid of cells x
+              cells cells spanning their bounding box; each cell holding
+              vertices is shown as a single node at their centroid, linked
+              to the cells its vertices have edges to
+            max_vertices: number of vertices kept in "vertices" mode
+            max_edges: number of edges kept in "edges" mode
+            roots: vertices to start from in "neighborhood" mode
+            hops: distance to the roots in "neighborhood" mode
+            cells: number of cells along each side in "grid" mode
+            seed: seed of the random sampling
+        Returns:
+            None
+        Raises:
+            ValueError: if the mode is unknown, or some roots are not
+             vertices of the graph (all are listed)
+        """
+        if mode not in (None, "vertices", "neighborhood", "edges", "grid"):
+            raise ValueError("Level of detail must be None, \"vertices\", \"neighborhood\", \"edges\" or \"grid\"")
+        if mode == "neighborhood":
+            roots = _as_list(roots if roots is not None else [])
+            missing = [k for k in roots if k not in self._key_index]
+            if missing:
+                raise ValueError("Vertices " + ", ".join(str(k) for k in missing) +
+                                 " do not exist! First add the vertices to the graph.")
+        self._lod = None if mode is None else {
+            "mode": mode, "max_vertices": max_vertices, "max_edges": max_edges,
+            "roots": roots, "hops": hops, "cells": cells, "seed": seed
+        }
+        self._lod_view = None
+        self._lod_version = -1
+
+    def _visible(self):
+        # None when the whole graph is shown, else arrays of the indices of
+        # the vertices shown (sorted), and of the sources and destinations
+        # of the edges shown; kept until the graph changes so that the type
+        # and the representation of the graph agree
+        if self._lod is None or self._lod["mode"] == "grid":
+            return None
+        if self._lod_version == self._version:
+            return self._lod_view
+        lod = self._lod
+        csr = self.freeze()
+        n = csr.num_vertices
+        srcs = csr.sources()
+        dests = csr.targets
+        rng = np.random.default_rng(lod["seed"])
+        if lod["mode"] == "vertices":
+            if n > lod["max_vertices"]:
+                # weighted sampling without replacement (Efraimidis-Spirakis):
+                # keep the vertices with the largest u^(1/weight)
+                weight = csr.out_degrees + csr.in_degrees() + 1.0
+                score = np.log(rng.random(n)) / weight
+                keep = np.zeros(n, dtype=bool)
+                keep[np.argpartition(score, n - lod["max_vertices"])[n - lod["max_vertices"]:]] = True
+            else:
+                keep = np.ones(n, dtype=bool)
+            shown = keep[srcs] & keep[dests]
+        elif lod["mode"] == "neighborhood":
+            keep = np.zeros(n, dtype=bool)
+            keep[[csr.index_of(k) for k in lod["roots"]]] = True
+            for _ in range(lod["hops"]):
+                reached = keep.copy()
+                reached[dests[keep[srcs]]] = True
+                reached[srcs[keep[dests]]] = True
+                keep = reached
+            shown = keep[srcs] & keep[dests]
+        else:
+            m = len(dests)
+            shown = np.zeros(m, dtype=bool)
+            shown[rng.choice(m, min(m, lod["max_edges"]), replace=False)] = True
+            keep = np.zeros(n, dtype=bool)
+            keep[srcs[shown]] = True
+            keep[dests[shown]] = True
+        self._lod_view = (np.nonzero(keep)[0], srcs[shown], dests[shown])
+        self._lod_version = self._version
+        return self._lod_view
+
+    def _node_keys(self, view) -> list:
+        # keys of the vertices shown, in the order of the nodes of the JSON
+        if view is None:
+            return self._keys
+        keys = self._keys
+        return [keys[i] for i in view[0].tolist()]
+
+    def _links(self, view):
+        # links shown: source element, source index, destination key,
+        # destination index, and source and destination node numbers
+        key_index = self._key_index
+        vertices = self.vertices
+        if view is None:
+            for src, edges in self._adj.items():
+                src_vert = vertices[src]
+                src_indx = key_index[src]
+                for dest in edges:
+                    dest_indx = key_index[dest]
+                    yield src_vert, src_indx, dest, dest_indx, src_indx, dest_indx
+            return
+        shown, srcs, dests = view
+        keys = self._keys
+        for src_indx, dest_indx, src_node, dest_node in zip(srcs.tolist(), dests.tolist(),
+                                                            np.searchsorted(shown, srcs).tolist(),
+                                                            np.searchsorted(shown, dests).tolist()):
+            yield vertices[keys[src_indx]], src_indx, keys[dest_indx], dest_indx, src_node, dest_node
+
     def get_data_structure_representation(self) -> dict:
         """
         Get the representation of the data structure as a dict
         Returns:
             dict: representing the JSON format before dumping to server
         """
-        node_map = dict()  # map to reorder the nodes for building JSON
-        nodes = []  # get the list nodes
-        nodes_JSON = []  # array for list of nodes in json
-        links_JSON = []  # array for building the links JSON - traverse the adj. lists
-
         # redirect for large graphs
-        if (GraphAdjList.force_large_viz == True or (GraphAdjList.force_small_viz == False and
-                                                     self.LargeGraphVertSize < len(self.vertices) and
-                                                     self.are_all_vertices_located())):
+        if self._use_large_graph():
             return self.get_data_structure_large_graph()
 
-        # get the objects and add them to the array
-        for elements in self.vertices.items():
-            nodes.append(elements[1])
-
-        # append all nodes representation to list of nodes
-        for i in range(0, len(nodes)):
-            node_map[nodes[i]] = i
-            nodes_JSON.append(nodes[i].get_element_representation())
-
-        # get all nodes in adj_list
-        for a_list in self.adj_list.items():
-            links_list = a_list[1]
-            src_vert = self.vertices.get(a_list[0])
-            #  get the source vertex index for the JSON (int)
-            while links_list is not None:
-                src_indx = node_map.get(src_vert)
-                #  get the destination vertex index for the JSON (int)
-                edge = links_list.value
-                dest_vert = self.vertices.get(edge.tov)
-                dest_indx = node_map.get(dest_vert)
-                #  get link representation
-                links_JSON.append((links_list.get_link_representation(
-                                   src_vert.get_link_visualizer(dest_vert),
-                                   str(src_indx),
-                                   str(dest_indx))))
-                links_list = links_list.next
+        if self._parallel():
+            return self._get_parallel_representation(large=False)
+        return self._get_representation(self._visible())
+
+    def _get_representation(self, view) -> dict:
+        # nodes are numbered by their index in the graph (or among the
+        # vertices shown)
+        nodes_JSON = [self.vertices[k].get_element_representation() for k in self._node_keys(view)]
+
+        links_JSON = []  # array for building the links JSON - traverse the adj. lists
+        for src_vert, src_indx, dest, dest_indx, src_node, dest_node in self._links(view):
+            #  get link representation
+            links_JSON.append(src_vert.get_link_representation(
+                              self._peek_link_visualizer(src_indx, dest_indx, src_vert, dest),
+                              str(src_node),
+                              str(dest_node)))
         json_str = {
             "nodes": nodes_JSON,
             "links": links_JSON
@@ -306,41 +1057,29 @@ class GraphAdjList:
         return json_str
 
     def get_data_structure_large_graph(self) -> dict:
-        nodes = []
-        node_map = dict()
-
-        for element in self.vertices.items():
-            nodes.append(element[1])
+        if self._lod is not None and self._lod["mode"] == "grid":
+            return self._get_large_graph_grid()
+        if self._large_graph_encoding == "binary":
+            return self._get_large_graph_binary(self._visible())
+        if self._parallel():
+            return self._get_parallel_representation(large=True)
+        return self._get_large_graph(self._visible())
 
+    def _get_large_graph(self, view) -> dict:
         nodes_json = []
-        for k in range(0, len(nodes)):
-            nodes_json.append([])
-            node_map[nodes[k]] = k
-            elvis = nodes[k].visualizer
-            loc_str = []
-            if elvis.location_x != float('inf') and elvis.location_y != float('inf'):
-                loc_str.append(elvis.location_x)
-                loc_str.append(elvis.location_y)
-                nodes_json[k].append(loc_str)
+        for k in self._node_keys(view):
+            node_json = []
+            elvis = self.vertices[k].visualizer
+            if elvis.is_located():
+                node_json.append([elvis.location_x, elvis.location_y])
             color = elvis.color
-            nodes_json[k].append([color.red, color.green, color.blue, color.alpha])
+            node_json.append([color.red, color.green, color.blue, color.alpha])
+            nodes_json.append(node_json)
 
         links_json = []
-        for a_list in self.adj_list.items():
-            list = a_list[1]
-            src_vert = self.vertices.get(a_list[0])
-            while list is not None:
-                link_json=[]
-                src_indx = node_map.get(src_vert)
-                edge = list.value
-                dest_vert = self.vertices.get(edge.tov)
-                dest_indx = node_map.get(dest_vert)
-                color = src_vert.get_link_visualizer(dest_vert).color
-                link_json.append(src_indx)
-                link_json.append(dest_indx)
-                link_json.append([color.red, color.green, color.blue, color.alpha])
-                links_json.append(link_json)
-                list = list.next
+        for src_vert, src_indx, dest, dest_indx, src_node, dest_node in self._links(view):
+            color = self._peek_link_visualizer(src_indx, dest_indx, src_vert, dest).color
+            links_json.append([src_node, dest_node, [color.red, color.green, color.blue, color.alpha]])
 
         graph_alist_json = {
             "nodes": nodes_json,
@@ -348,3 +1087,252 @@ class GraphAdjList:
         }
 
         return graph_alist_json
+
+    def _get_large_graph_binary(self, view) -> dict:
+        keys = self._node_keys(view)
+        n = len(keys)
+        locations = np.full((n, 2), np.nan, dtype=np.float32)
+        node_colors = np.empty((n, 4), dtype=np.uint8)
+        for k, key in enumerate(keys):
+            elvis = self.vertices[key].visualizer
+            if elvis.is_located():
+                locations[k] = (float(elvis.location_x), float(elvis.location_y))
+            node_colors[k] = elvis.color.get_byte_representation()
+
+        sources = []
+        targets = []
+        link_colors = []
+        # most links share the default visualizer, convert each color once
+        color_bytes = dict()
+        for src_vert, src_indx, dest, dest_indx, src_node, dest_node in self._links(view):
+            sources.append(src_node)
+            targets.append(dest_node)
+            lv = self._peek_link_visualizer(src_indx, dest_indx, src_vert, dest)
+            if lv not in color_bytes:
+                color_bytes[lv] = lv.color.get_byte_representation()
+            link_colors.append(color_bytes[lv])
+
+        return graph_encoding.encode_large_graph(locations, node_colors, sources, targets,
+                                                 np.array(link_colors, dtype=np.uint8).reshape(-1, 4))
+
+    def _get_parallel_representation(self, large: bool) -> dict:
+        global _forked_graph
+        csr = self.freeze()
+        # vertex ranges of about the same number of nodes and links, a few
+        # per process so that they even out
+        parts = self._processes * 4
+        work = csr.offsets + np.arange(csr.num_vertices + 1)
+        bounds = np.unique(np.searchsorted(work, np.linspace(0, work[-1], parts + 1)))
+        ranges = [(large, int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:])]
+        _forked_graph = self
+        try:
+            with multiprocessing.get_context("fork").Pool(self._processes) as pool:
+                fragments = pool.map(_serialize_range, ranges)
+        finally:
+            _forked_graph = None
+        return {
+            "nodes": graph_encoding.RawJSON("[" + ", ".join(f[0] for f in fragments if f[0]) + "]"),
+            "links": graph_encoding.RawJSON("[" + ", ".join(f[1] for f in fragments if f[1]) + "]")
+        }
+
+    def _serialize_vertex_range(self, large: bool, start: int, stop: int):
+        # JSON text of the nodes start to stop (excluded) and of their
+        # outgoing links, without the enclosing brackets
+        csr = self.freeze()
+        keys = self._keys
+        vertices = self.vertices
+        nodes = []
+        links = []
+        for src_indx in range(start, stop):
+            src = keys[src_indx]
+            src_vert = vertices[src]
+            if large:
+                elvis = src_vert.visualizer
+                node = []
+                if elvis.is_located():
+                    node.append([elvis.location_x, elvis.location_y])
+                color = elvis.color
+                node.append([color.red, color.green, color.blue, color.alpha])
+                nodes.append(node)
+            else:
+                nodes.append(src_vert.get_element_representation())
+            for dest_indx in csr.neighbors(src_indx).tolist():
+                dest = keys[dest_indx]
+                lv = self._peek_link_visualizer(src_indx, dest_indx, src_vert, dest)
+                if large:
+                    color = lv.color
+                    links.append([src_indx, dest_indx, [color.red, color.green, color.blue, color.alpha]])
+                else:
+                    links.append(src_vert.get_link_representation(lv, str(src_indx), str(dest_indx)))
+        return json.dumps(nodes)[1:-1], json.dumps(links)[1:-1]
+
+    def _get_large_graph_grid(self) -> dict:
+        # "grid" level of detail: one node per cell holding located vertices
+        csr = self.freeze()
+        n = csr.num_vertices
+        locations = np.full((n, 2), np.nan)
+        for i, key in enumerate(self._keys):
+            elvis = self.vertices[key].visualizer
+            if elvis.is_located():
+                locations[i] = (float(elvis.location_x), float(elvis.location_y))
+        located = ~np.isnan(locations[:, 0])
+        cells = self._lod["cells"]
+        cell = np.full(n, -1, dtype=np.int64)
+        if located.any():
+            lo = locations[located].min(axis=0)
+            span = np.maximum(locations[located].max(axis=0) - lo, 1e-12)
+            cxy = np.minimum(((locations[located] - lo) / span * cells).astype(np.int64), cells - 1)
+            cell[located] = cxy[:, 0] * cells + cxy[:, 1]
+        used, members = np.unique(cell[located], return_inverse=True)
+        node = np.full(n, -1, dtype=np.int64)
+        node[located] = members
+        count = np.bincount(members, minlength=len(used))
+        centroids = np.column_stack([np.bincount(members, weights=locations[located, axis], minlength=len(used))
+                                     for axis in (0, 1)]) / np.maximum(count, 1)[:, None]
+        # a cell takes the color of its first vertex
+        first = np.nonzero(located)[0][np.unique(members, return_index=True)[1]]
+        node_colors = np.array([self.vertices[self._keys[i]].visualizer.color.get_byte_representation()
+                                for i in first.tolist()], dtype=np.uint8).reshape(-1, 4)
+
+        srcs = node[csr.sources()]
+        dests = node[csr.targets]
+        both = (srcs >= 0) & (dests >= 0) & (srcs != dests)
+        pairs = np.unique(srcs[both] * len(used) + dests[both])
+        sources = pairs // max(len(used), 1)
+        targets = pairs % max(len(used), 1)
+        link_colors = np.tile(np.array(_default_link_visualizer.color.get_byte_representation(), dtype=np.uint8),
+                              (len(pairs), 1))
+
+        if self._large_graph_encoding == "binary":
+            return graph_encoding.encode_large_graph(centroids, node_colors, sources, targets, link_colors)
+
+        def color(c):
+            return [int(c[0]), int(c[1]), int(c[2]), float(c[3]) / 255.0]
+
+        return {
+            "nodes": [[[float(x), float(y)], color(c)] for (x, y), c in zip(centroids.tolist(), node_colors)],
+            "links": [[s, d, color(c)] for s, d, c in zip(sources.tolist(), targets.tolist(), link_colors)]
+        }
+
+
+# graph whose JSON the worker processes build, they inherit it when forked
+_forked_graph = None
+
+
+def _serialize_range(args):
+    return _forked_graph._serialize_vertex_range(*args)
+
+
+def _as_list(values) -> list:
+    # numpy arrays become lists of plain python values, usable as keys
+    if hasattr(values, "tolist"):
+        return values.tolist()
+    return list(values)
+
+
+class _AdjListView(collections.abc.MutableMapping):
+    """
+    Adjacency lists of a graph, keyed by vertex; the linked list of a
+    vertex is only built when it is looked up
+    """
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph) -> None:
+        self._graph = graph
+
+    def __getitem__(self, k):
+        return _EdgeListNode.head(list(self._graph._adj[k].values()))
+
+    def __setitem__(self, k, head) -> None:
+        self._graph._set_out_edges(k, head)
+
+    def __delitem__(self, k) -> None:
+        raise TypeError("Use GraphAdjList.remove_vertex() to remove a vertex")
+
+    def __len__(self) -> int:
+        return len(self._graph._keys)
+
+    def __iter__(self):
+        return iter(self._graph._keys)
+
+    def __contains__(self, k) -> bool:
+        return k in self._graph._key_index
+
+
+class _KeySet(collections.abc.Set):
+    """
+    Live view of the keys of a graph, in vertex index order
+    """
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph) -> None:
+        self._graph = graph
+
+    def __len__(self) -> int:
+        return len(self._graph._keys)
+
+    def __iter__(self):
+        return iter(self._graph._keys)
+
+    def __contains__(self, k) -> bool:
+        return k in self._graph._key_index
+
+    @classmethod
+    def _from_iterable(cls, it):
+        # results of set operations are plain sets
+        return set(it)
+
+    def __repr__(self) -> str:
+        return "key_set(" + repr(self._graph._keys) + ")"
+
+
+class _ValueSet(collections.abc.Collection):
+    """
+    Live view of the vertex elements of a graph, in vertex index order
+    """
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph) -> None:
+        self._graph = graph
+
+    def __len__(self) -> int:
+        return len(self._graph._keys)
+
+    def __iter__(self):
+        vertices = self._graph.vertices
+        return (vertices[k] for k in self._graph._keys)
+
+    def __contains__(self, el) -> bool:
+        return any(v is el or v == el for v in self)
+
+
+class _EdgeListNode:
+    """
+    Node of the linked list view of an adjacency list; value is the Edge
+    and next the following node (None at the end of the list), as with
+    the SLelement chains adjacency lists used to be made of.
+    """
+    __slots__ = ("_edges", "_pos")
+
+    def __init__(self, edges, pos) -> None:
+        self._edges = edges
+        self._pos = pos
+
+    @staticmethod
+    def head(edges):
+        if len(edges) == 0:
+            return None
+        return _EdgeListNode(edges, 0)
+
+    @property
+    def value(self) -> Edge:
+        return self._edges[self._pos]
+
+    @property
+    def next(self):
+        if self._pos + 1 < len(self._edges):
+            return _EdgeListNode(self._edges, self._pos + 1)
+        return None
+
+    def __iter__(self):
+        return iter(self._edges[self._pos:])
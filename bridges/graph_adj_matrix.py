@@ -1,4 +1,6 @@
 from bridges.element import *
+from collections.abc import MutableMapping
+import numpy as np
 import traceback
 ##
 #
@@ -23,6 +25,13 @@ import traceback
 #  Convenience methods are provided to add vertices and edges to the graph. Edges
 #  are retrieved by using the dual hashmap, given the vertex ids of the edge.
 #
+#  The weights are held in a numpy array indexed by vertex position (in
+#  order of insertion), grown by doubling as vertices are added. For large
+#  graphs with few edges, GraphAdjMatrix(sparse = True) keeps only the
+#  nonzero weights, in a dictionary keyed by (row, column) coordinates.
+#  get_adjacency_matrix() still presents the matrix as a dictionary of rows
+#  keyed by vertex, and writing to these rows updates the graph.
+#
 #  @author Kalpathi Subramanian, Mihai Mehedint
 #
 #
@@ -33,9 +42,19 @@ class GraphAdjMatrix():
     ##
     #     Constructor
     #
-    def __init__(self):
+    #     @param sparse - store only the nonzero weights instead of a dense array
+    #
+    def __init__(self, sparse = False):
         self._vertices = dict()
-        self._matrix = dict()
+        self._index = dict()  # vertex key -> row/column of the matrix
+        self._keys = []
+        self._sparse = sparse
+        if sparse:
+            self._entries = dict()  # (row, column) -> weight
+        else:
+            # integer until a weight that is not an int is stored, so that
+            # unweighted graphs read back int weights
+            self._weights = np.zeros((0, 0), dtype=np.int64)
         self._edge_data = dict()
 
     ##
@@ -48,6 +67,46 @@ class GraphAdjMatrix():
     def get_data_structure_type(self):
         return "GraphAdjacencyMatrix"
 
+    def _grow(self, n):
+        #  make room for n vertices, doubling the capacity to amortize copies
+        if self._sparse or n <= self._weights.shape[0]:
+            return
+        cap = max(n, 2 * self._weights.shape[0], 16)
+        weights = np.zeros((cap, cap), dtype=self._weights.dtype)
+        old = self._weights.shape[0]
+        weights[:old, :old] = self._weights
+        self._weights = weights
+
+    def _get_weight(self, i, j):
+        if self._sparse:
+            return self._entries.get((i, j), 0)
+        return self._weights[i, j].item()
+
+    def _allow_weights(self, weights):
+        #  switch the dense array to float once a weight is not an int
+        if not self._sparse and self._weights.dtype.kind == "i" and \
+                not all(isinstance(w, (int, np.integer)) for w in weights):
+            self._weights = self._weights.astype(np.float64)
+
+    def _set_weight(self, i, j, w):
+        if self._sparse:
+            if w == 0:
+                self._entries.pop((i, j), None)
+            else:
+                self._entries[(i, j)] = w
+        else:
+            self._allow_weights([w])
+            self._weights[i, j] = w
+
+    def _clear(self, i):
+        #  zero the row and column of a vertex that is added again
+        if self._sparse:
+            for c in [c for c in self._entries if i in c]:
+                del self._entries[c]
+        else:
+            self._weights[i, :] = 0
+            self._weights[:, i] = 0
+
     ##
     #     Adds a new vertex to the graph, initializes the  adjacency
     #     list; user is responsible for checking if the vertex already
@@ -63,12 +122,39 @@ class GraphAdjMatrix():
         self.vertices[k] = Element(val = e)
         self.vertices.get(k).label = str(k)
 
-        #  create a hashmap for this vertex
-        self._matrix[k] =  dict()
-        #  fill up this vertex's row and column elements
-        for k, element in self.vertices.items():
-            (self._matrix.get(k))[element.label] = 0 #  row
-            (self._matrix.get(element.label))[k] =  0 #  col
+        #  the row and column of a new vertex are zero already
+        if k not in self._index:
+            self._index[k] = len(self._keys)
+            self._keys.append(k)
+            self._grow(len(self._keys))
+        else:
+            self._clear(self._index[k])
+
+    ##
+    #     Adds many vertices at once, as add_vertex() does for each of them
+    #
+    #     @param keys - iterable (or numpy array) of vertex key values
+    #     @param values - iterable of user specified data, in the order of keys
+    #         (None to leave the data of all vertices empty)
+    #
+    #
+    def add_vertices(self, keys, values = None):
+        keys = keys.tolist() if hasattr(keys, "tolist") else list(keys)
+        if values is None:
+            values = [None] * len(keys)
+        else:
+            values = values.tolist() if hasattr(values, "tolist") else list(values)
+        if len(keys) != len(values):
+            raise ValueError("add_vertices: " + str(len(keys)) + " keys but " + str(len(values)) + " values")
+
+        for k, e in zip(keys, values):
+            self.vertices[k] = Element(val = e, label = str(k))
+            if k not in self._index:
+                self._index[k] = len(self._keys)
+                self._keys.append(k)
+            else:
+                self._clear(self._index[k])
+        self._grow(len(self._keys))
 
     ##
     #    Adds a new edge to the graph, adds it to the index corresponding to
@@ -89,9 +175,44 @@ class GraphAdjMatrix():
         except Exception as e:
             traceback.print_tb(e.__traceback__)
         if weight is not None:
-            (self._matrix.get(src))[dest] = weight
+            self._set_weight(self._index[src], self._index[dest], weight)
         else:
-            (self._matrix.get(src))[dest] =  1
+            self._set_weight(self._index[src], self._index[dest], 1)
+
+    ##
+    #    Adds many edges at once, as add_edge() does for each of them. All
+    #    endpoints are checked before any edge is added, and the ones that
+    #    are not vertices of the graph are all reported in the ValueError.
+    #
+    #    @param srcs - iterable (or numpy array) of source vertices
+    #    @param dests - iterable of destination vertices, in the order of srcs
+    #    @param weights - iterable of edge weights in the order of srcs, or a
+    #        single weight for every edge (1 by default)
+    #
+    #
+    def add_edges(self, srcs, dests, weights = None):
+        srcs = srcs.tolist() if hasattr(srcs, "tolist") else list(srcs)
+        dests = dests.tolist() if hasattr(dests, "tolist") else list(dests)
+        if weights is None or isinstance(weights, (int, float)):
+            weights = [1 if weights is None else weights] * len(srcs)
+        else:
+            weights = weights.tolist() if hasattr(weights, "tolist") else list(weights)
+        if len(srcs) != len(dests) or len(srcs) != len(weights):
+            raise ValueError("add_edges: srcs, dests and weights must have the same length")
+
+        missing = [v for v in set(srcs).union(dests) if v not in self.vertices]
+        if missing:
+            raise ValueError("Vertices " + ", ".join(str(v) for v in missing) +
+                             " do not exist! Add the vertices before creating the edges.")
+
+        rows = [self._index[v] for v in srcs]
+        cols = [self._index[v] for v in dests]
+        if self._sparse:
+            for i, j, w in zip(rows, cols, weights):
+                self._set_weight(i, j, w)
+        else:
+            self._allow_weights(weights)
+            self._weights[rows, cols] = weights
 
     @property
     def vertices(self):
@@ -120,7 +241,7 @@ class GraphAdjMatrix():
 					" does not exist! Add the vertex before creating the edge.")
         except Exception as e:
             traceback.print_tb(e.__traceback__)
-        self._edge_data.get(src)[dest] = data
+        self._edge_data[(src, dest)] = data
 
     def get_edge_data(self, src, dest):
         try:
@@ -129,19 +250,50 @@ class GraphAdjMatrix():
                                  " does not exist! Add the vertex before creating the edge.")
         except Exception as e:
             traceback.print_tb(e.__traceback__)
-        return self._edge_data.get(src)[dest]
+        return self._edge_data.get((src, dest))
 
     ##
     #
     #    Gets the adjacency matrix
     #
-    #    @return - the graph's adjacency matrix
+    #    @param key - vertex whose row is wanted (None for the whole matrix)
+    #
+    #    @return - the graph's adjacency matrix, as a dictionary of rows keyed by
+    #        vertex; each row maps destination vertices to weights (0 for no edge)
     #
     def get_adjacency_matrix(self, key = None):
         if key is None:
-            return self._matrix
-        else:
-            return self._matrix.get(key)
+            return {k: _MatrixRow(self, i) for k, i in self._index.items()}
+        elif key in self._index:
+            return _MatrixRow(self, self._index[key])
+        return None
+
+    ##
+    #
+    #    Gets the weights as a numpy array, rows and columns in the order the
+    #    vertices were added (a copy in sparse mode)
+    #
+    #    @return - (n x n) array of weights
+    #
+    def get_adjacency_array(self):
+        n = len(self._keys)
+        if not self._sparse:
+            return self._weights[:n, :n]
+        rows, cols, weights = self._nonzero()
+        ret = np.zeros((n, n), dtype=weights.dtype if len(weights) else np.int64)
+        ret[rows, cols] = weights
+        return ret
+
+    def _nonzero(self):
+        #  (rows, columns, weights) of the edges, in row major order
+        if self._sparse:
+            coords = sorted(c for c, w in self._entries.items() if w > 0)
+            rows = np.array([c[0] for c in coords], dtype=np.int64)
+            cols = np.array([c[1] for c in coords], dtype=np.int64)
+            return rows, cols, np.array([self._entries[c] for c in coords])
+        n = len(self._keys)
+        rows, cols = np.nonzero(self._weights[:n, :n] > 0)
+        return rows, cols, self._weights[rows, cols]
 
     ##
     #
@@ -184,30 +336,47 @@ class GraphAdjMatrix():
     #     Get the JSON representation of the the data structure
     #
     def get_data_structure_representation(self):
-        node_map = dict()
-        nodes = []
-        nodes_json = []
-        for key, value in self.vertices.items():
-            nodes.append(value)
-
-        for k in range(0, len(nodes)):
-            node_map[nodes[k]] = k
-            nodes_json.append(nodes[k].get_element_representation())
+        nodes = [self.vertices[k] for k in self._keys]
+        nodes_json = [node.get_element_representation() for node in nodes]
 
+        #  the links are the nonzero entries of the matrix
+        rows, cols, weights = self._nonzero()
         links_json = []
-        for el_src in self._matrix.items():
-            src_vert = self.vertices.get(el_src[0])
-            src_indx = node_map.get(src_vert)
-
-            for el_dest in el_src[1].items():
-                dest_vert = self.vertices.get(el_dest[0])
-                if el_dest[1] > 0:
-                    dest_indx = node_map.get(dest_vert)
-                    links_json.append(src_vert.get_link_representation(src_vert.get_link_visualizer(dest_vert),
-                                                                       str(src_indx), str(dest_indx)))
+        for src_indx, dest_indx in zip(rows.tolist(), cols.tolist()):
+            src_vert = nodes[src_indx]
+            dest_vert = nodes[dest_indx]
+            links_json.append(src_vert.get_link_representation(src_vert.peek_link_visualizer(dest_vert),
+                                                               str(src_indx), str(dest_indx)))
         json_str = {
             "nodes": nodes_json,
             "links": links_json
         }
 
         return json_str
+
+
+class _MatrixRow(MutableMapping):
+    #  row of a GraphAdjMatrix, seen as a dictionary from destination vertex
+    #  to weight; reads and writes go to the graph's matrix
+
+    def __init__(self, graph, row):
+        self._graph = graph
+        self._row = row
+
+    def __getitem__(self, dest):
+        return self._graph._get_weight(self._row, self._graph._index[dest])
+
+    def __setitem__(self, dest, weight):
+        self._graph._set_weight(self._row, self._graph._index[dest], weight)
+
+    def __delitem__(self, dest):
+        self._graph._set_weight(self._row, self._graph._index[dest], 0)
+
+    def __iter__(self):
+        return iter(self._graph._keys)
+
+    def __len__(self):
+        return len(self._graph._keys)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
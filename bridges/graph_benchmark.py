@@ -1,59 +1,47 @@
 from bridges.graph_adj_list import *
 from bridges.data_src_dependent.data_source import *
+from bridges import generators
 import sys
 
 class GraphBenchmark:
 
     def __init__(self):
         self._time_cap = sys.float_info.max
+        self._validate = False
+        self._generator = None
+        self._max_edges = 10000000
 
     def _genertate_wiki_data_movie_actor(self, year_min, year_max, movie_graph):
-        v = get_wiki_data_actor_movie(year_min, year_max)
-        edge_count = 0
-        vertex_count = 0
-
-        for ma in v:
-            movie_vertex = movie_graph.get_vertex(ma.movie_name)
-            if movie_vertex is None:
-                movie_graph.add_vertex(ma.movie_uri, ma.movie_name)
-                movie_vertex = movie_graph.get_vertex(ma.movie_uri)
-                vertex_count += 1
-
-            actor_vertex = movie_graph.get_vertex(ma.actor_uri)
-            if actor_vertex is None:
-                movie_graph.add_vertex(ma.actor_uri, ma.actor_name)
-                actor_vertex = movie_graph.get_vertex(ma.actor_uri)
-                vertex_count += 1
-
-            movie_graph.add_edge(ma.movie_uri, ma.actor_uri)
-            movie_graph.add_edge(ma.actor_uri, ma.movie_uri)
-            edge_count += 2
-
-        return vertex_count, edge_count
+        actor_movie_graph(get_wiki_data_actor_movie(year_min, year_max), graph=movie_graph)
+        return self._count_vertices(movie_graph), self._count_edges(movie_graph)
+
+    def _input_graphs(self):
+        # the graphs to run the algorithms on, growing: (graph, number of
+        # vertices, number of edges)
+        if self._generator is None:
+            years = 0
+            while years < 120:
+                year = 2019 - years
+                graph = GraphAdjList()
+                vertex_count, edge_count = self._genertate_wiki_data_movie_actor(int(year), 2019, graph)
+                yield graph, vertex_count, edge_count
+                years = 1.2 * years + 1
+        else:
+            edges = 1000
+            while edges <= self._max_edges:
+                graph = self._generator(edges)
+                yield graph, self._count_vertices(graph), self._count_edges(graph)
+                edges = int(1.5 * edges)
 
     def _highest_degree_vertex(self, gr):
-        max_degree = -1
-        ret = ""
-
-        for k in gr.key_set():
-            degree = 0
-            for e in gr.out_going_edge_set_of(k):
-                degree += 1
-            if degree > max_degree:
-                max_degree = degree
-                ret = k
-
-        return ret
+        top = gr.top_k_by_degree(1)
+        return top[0] if top else ""
 
     def _count_vertices(self, gr):
         return len(gr.vertices)
 
     def _count_edges(self, gr):
-        edges = 0
-        for k in gr.key_set():
-            for e in gr.out_going_edge_set_of(k):
-                edges+=1
-        return edges
+        return gr.edge_count()
 
     @property
     def time_cap(self):
@@ -68,3 +56,61 @@ class GraphBenchmark:
 
 
 
+
+    @property
+    def validate(self):
+        """
+        Getter for whether the results of the benchmarked algorithm are
+        checked against the reference implementations of bridges.algorithms
+        """
+        return self._validate
+
+    @validate.setter
+    def validate(self, check):
+        self._validate = check
+
+    @property
+    def generator(self):
+        """
+        Getter for the source of the input graphs; None (the default) for
+        actor-movie graphs of Wikidata, over more and more years
+        """
+        return self._generator
+
+    @generator.setter
+    def generator(self, gen):
+        """
+        Setter for the source of the input graphs, to benchmark offline on
+        reproducible graphs
+        Args:
+            gen: None for Wikidata actor-movie graphs; the name of a kind of
+             graph of generators.with_edges() (such as "rmat"), generated
+             with seed 0; or a function taking a number of edges and
+             returning a GraphAdjList with about that many edges. Graphs of
+             1000 edges, then 1.5 times larger each time, up to max_edges,
+             are used.
+        Raises:
+            ValueError: if the kind of graph is unknown
+        """
+        if isinstance(gen, str):
+            kind = gen
+            if kind not in generators.KINDS:
+                raise ValueError("Unknown kind of graph " + kind)
+
+            def gen(edges):
+                return generators.with_edges(kind, edges, seed=0)
+        self._generator = gen
+
+    @property
+    def max_edges(self):
+        """
+        Getter for the size of the largest generated input graph
+        """
+        return self._max_edges
+
+    @max_edges.setter
+    def max_edges(self, edges):
+        self._max_edges = edges
+
+    def _report_mismatch(self, algo_name, what, size):
+        print(f"{algo_name}: {what} differ from the reference implementation on the graph with {size} edges")
@@ -0,0 +1,232 @@
+import numpy as np
+
+
+##
+#
+#    @brief The GraphCSR class is an immutable compressed sparse row snapshot
+#        of a graph, meant for running graph algorithms fast
+#
+#    Vertices are numbered densely from 0 to num_vertices-1; key_of() and
+#    index_of() convert between these indices and the vertex keys of the
+#    graph the snapshot was taken from. The outgoing edges of vertex i are
+#    the entries offsets[i] to offsets[i+1] (excluded) of targets (and of
+#    weights, when the edges carry numeric data).
+#
+#    Snapshots are obtained with GraphAdjList.freeze(); they do not follow
+#    later changes of the graph, freeze() builds a new one when needed.
+#
+#    \sa GraphAdjList.freeze()
+#
+class GraphCSR:
+
+    def __init__(self, keys: list, offsets, targets, weights=None, index: dict = None) -> None:
+        """
+        Constructor for a CSR snapshot
+        Args:
+            keys: vertex keys, in index order (any sequence)
+            offsets: array of num_vertices+1 offsets into targets
+            targets: array of destination vertex indices
+            weights: array of edge weights (same length as targets), or None
+            index: map from key to index, built from keys when first
+             needed if None
+        Returns:
+            None
+        """
+        self._keys = keys
+        self._index = index
+        self._offsets = np.asarray(offsets, dtype=np.int64)
+        self._targets = np.asarray(targets, dtype=np.int64)
+        self._weights = None if weights is None else np.asarray(weights, dtype=np.float64)
+        for a in (self._offsets, self._targets, self._weights):
+            if a is not None:
+                a.flags.writeable = False
+        self._out_degrees = None
+
+    @staticmethod
+    def from_graph(graph) -> "GraphCSR":
+        """
+        Build the snapshot of a graph
+        Args:
+            graph: a GraphAdjList (or any graph with key_set() and
+             out_going_edge_set_of())
+        Returns:
+            GraphCSR: edge weights are the edge data when all edges hold
+            numbers or None (counted as 1), else the snapshot is unweighted
+        """
+        keys = list(graph.key_set())
+        index = {k: i for i, k in enumerate(keys)}
+        return GraphCSR.from_adjacency(keys, index, {k: graph.out_going_edge_set_of(k) for k in keys})
+
+    @staticmethod
+    def from_adjacency(keys: list, index: dict, adjacency) -> "GraphCSR":
+        """
+        Build a snapshot from adjacency lists
+        Args:
+            keys: vertex keys, in index order
+            index: map from key to index
+            adjacency: map from key to its outgoing edges (Edge objects),
+             or to a dict whose values are the outgoing edges
+        Returns:
+            GraphCSR
+        """
+        offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+        targets = []
+        weights = []
+        weighted = True
+        for i, k in enumerate(keys):
+            edges = adjacency[k]
+            if isinstance(edges, dict):
+                edges = edges.values()
+            offsets[i + 1] = len(edges)
+            for edge in edges:
+                targets.append(index[edge.tov])
+                if weighted:
+                    data = edge.edge_data
+                    if data is None:
+                        weights.append(1.0)
+                    elif isinstance(data, (int, float)) and not isinstance(data, bool):
+                        weights.append(data)
+                    else:
+                        weighted = False
+        np.cumsum(offsets, out=offsets)
+        if not weighted or all(w == 1.0 for w in weights):
+            weights = None
+        return GraphCSR(list(keys), offsets, np.array(targets, dtype=np.int64), weights, dict(index))
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self._keys)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self._targets)
+
+    @property
+    def keys(self) -> list:
+        """
+        Getter for the vertex keys, in index order
+        Returns:
+            list
+        """
+        return self._keys
+
+    @property
+    def offsets(self):
+        return self._offsets
+
+    @property
+    def targets(self):
+        return self._targets
+
+    @property
+    def weights(self):
+        """
+        Getter for the edge weights
+        Returns:
+            array of float, or None if the graph is unweighted
+        """
+        return self._weights
+
+    def index_of(self, key) -> int:
+        """
+        Index of a vertex
+        Args:
+            key: the vertex key
+        Returns:
+            int: index of the vertex in the snapshot
+        """
+        if self._index is None:
+            self._index = {k: i for i, k in enumerate(self._keys)}
+        return self._index[key]
+
+    def key_of(self, i: int):
+        """
+        Key of a vertex
+        Args:
+            i: index of the vertex in the snapshot
+        Returns:
+            the vertex key
+        """
+        return self._keys[i]
+
+    def neighbors(self, i: int):
+        """
+        Destinations of the outgoing edges of a vertex
+        Args:
+            i: index of the vertex
+        Returns:
+            array of vertex indices
+        """
+        return self._targets[self._offsets[i]:self._offsets[i + 1]]
+
+    def neighbor_weights(self, i: int):
+        """
+        Weights of the outgoing edges of a vertex, in the order of neighbors()
+        Args:
+            i: index of the vertex
+        Returns:
+            array of float
+        """
+        if self._weights is None:
+            return np.ones(self._offsets[i + 1] - self._offsets[i])
+        return self._weights[self._offsets[i]:self._offsets[i + 1]]
+
+    def degree(self, i: int) -> int:
+        """
+        Out degree of a vertex
+        Args:
+            i: index of the vertex
+        Returns:
+            int
+        """
+        return int(self._offsets[i + 1] - self._offsets[i])
+
+    @property
+    def out_degrees(self):
+        """
+        Getter for the out degree of every vertex
+        Returns:
+            array of int, indexed by vertex index
+        """
+        if self._out_degrees is None:
+            self._out_degrees = np.diff(self._offsets)
+            self._out_degrees.flags.writeable = False
+        return self._out_degrees
+
+    def in_degrees(self):
+        """
+        In degree of every vertex
+        Returns:
+            array of int, indexed by vertex index
+        """
+        return np.bincount(self._targets, minlength=self.num_vertices)
+
+    def sources(self):
+        """
+        Source vertex of every edge, in the order of targets
+        Returns:
+            array of vertex indices
+        """
+        return np.repeat(np.arange(self.num_vertices), self.out_degrees)
+
+    @staticmethod
+    def from_edges(num_vertices: int, srcs, dests, weights=None, keys: list = None) -> "GraphCSR":
+        """
+        Build a snapshot from arrays of edges
+        Args:
+            num_vertices: number of vertices
+            srcs: array of source vertex indices
+            dests: array of destination vertex indices, in the order of srcs
+            weights: array of edge weights in the order of srcs, or None
+            keys: vertex keys in index order, the indices themselves if None
+        Returns:
+            GraphCSR: the outgoing edges of each vertex keep the order of
+            the arrays
+        """
+        srcs = np.asarray(srcs, dtype=np.int64)
+        order = np.argsort(srcs, kind="stable")
+        offsets = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(srcs, minlength=num_vertices), out=offsets[1:])
+        return GraphCSR(list(range(num_vertices)) if keys is None else keys, offsets,
+                        np.asarray(dests, dtype=np.int64)[order],
+                        None if weights is None else np.asarray(weights, dtype=np.float64)[order])
@@ -0,0 +1,153 @@
+import base64
+import json
+import numpy as np
+
+
+##
+#
+#    @brief Compact binary encoding of the node and link arrays of large graphs
+#
+#    The "largegraph" representation lists, for every node, its location and
+#    RGBA color, and for every link its endpoints and RGBA color. As JSON
+#    numbers these take many bytes each; encode_large_graph() packs them as
+#    base64 strings of little-endian typed arrays instead:
+#
+#    - node locations: float32 x, y pairs (NaN for nodes without location)
+#    - link endpoints: uint32 source, target pairs
+#    - colors: uint8 RGBA quadruples, or when few distinct colors are used
+#      (as is usual), a palette of uint8 RGBA quadruples and one uint8 index
+#      per node/link
+#
+#    decode_large_graph() turns the result back into the JSON form, as a
+#    server (or a local stand-in for one) would.
+#
+#    RawJSON and dumps() let representations hold parts that are already
+#    JSON text (such as the fragments built in parallel for big graphs),
+#    which are spliced in the output instead of being parsed and encoded
+#    again.
+#
+#    \sa GraphAdjList.set_large_graph_encoding()
+#
+
+def _b64(array, dtype) -> str:
+    return base64.b64encode(np.ascontiguousarray(array, dtype=dtype).tobytes()).decode()
+
+
+def _unb64(text, dtype):
+    return np.frombuffer(base64.b64decode(text), dtype=dtype)
+
+
+def _encode_colors(rgba) -> dict:
+    rgba = np.ascontiguousarray(rgba, dtype=np.uint8).reshape(-1, 4)
+    if len(rgba) == 0:
+        return {"rgba": ""}
+    palette, indices = np.unique(rgba.view(np.uint32).ravel(), return_inverse=True)
+    if len(palette) <= 256:
+        return {
+            "palette": _b64(palette.view(np.uint8), np.uint8),
+            "indices": _b64(indices, np.uint8)
+        }
+    return {"rgba": _b64(rgba, np.uint8)}
+
+
+def _decode_colors(colors):
+    if "palette" in colors:
+        palette = _unb64(colors["palette"], np.uint8).reshape(-1, 4)
+        return palette[_unb64(colors["indices"], np.uint8)]
+    return _unb64(colors["rgba"], np.uint8).reshape(-1, 4)
+
+
+def encode_large_graph(locations, node_colors, sources, targets, link_colors) -> dict:
+    """
+    Binary representation of a large graph
+    Args:
+        locations: (n x 2) array of node locations, NaN where unknown
+        node_colors: (n x 4) array of node RGBA colors (0-255)
+        sources: array of link source node indices
+        targets: array of link target node indices
+        link_colors: (m x 4) array of link RGBA colors (0-255)
+    Returns:
+        dict: nodes and links, to be merged in the visualization JSON
+    """
+    endpoints = np.empty((len(sources), 2), dtype="<u4")
+    endpoints[:, 0] = sources
+    endpoints[:, 1] = targets
+    return {
+        "encoding": "binary",
+        "nodes": {
+            "count": len(node_colors),
+            "locations": _b64(locations, "<f4"),
+            "colors": _encode_colors(node_colors)
+        },
+        "links": {
+            "count": len(endpoints),
+            "endpoints": _b64(endpoints, "<u4"),
+            "colors": _encode_colors(link_colors)
+        }
+    }
+
+
+def decode_large_graph(json_dict) -> dict:
+    """
+    Turn the binary representation back into the JSON form of the largegraph
+    representation (colors with an alpha between 0 and 1)
+    Args:
+        json_dict: the output of encode_large_graph()
+    Returns:
+        dict: with the "nodes" and "links" lists
+    """
+    nodes = json_dict["nodes"]
+    links = json_dict["links"]
+    locations = _unb64(nodes["locations"], "<f4").reshape(-1, 2)
+    node_colors = _decode_colors(nodes["colors"]).reshape(-1, 4)
+    endpoints = _unb64(links["endpoints"], "<u4").reshape(-1, 2)
+    link_colors = _decode_colors(links["colors"]).reshape(-1, 4)
+
+    def color(c):
+        return [int(c[0]), int(c[1]), int(c[2]), float(c[3]) / 255.0]
+
+    nodes_json = []
+    for k in range(nodes["count"]):
+        node = []
+        if not np.isnan(locations[k]).any():
+            node.append([float(locations[k][0]), float(locations[k][1])])
+        node.append(color(node_colors[k]))
+        nodes_json.append(node)
+    links_json = [[int(endpoints[k][0]), int(endpoints[k][1]), color(link_colors[k])]
+                  for k in range(links["count"])]
+    return {
+        "nodes": nodes_json,
+        "links": links_json
+    }
+
+
+class RawJSON:
+    """
+    Text that is already JSON, inserted as is by dumps()
+    """
+    __slots__ = ("text",)
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+def dumps(obj) -> str:
+    """
+    json.dumps() that accepts RawJSON values
+    Args:
+        obj: the object to encode
+    Returns:
+        str: the JSON text
+    """
+    raw = []
+
+    def placeholder(o):
+        if isinstance(o, RawJSON):
+            raw.append(o.text)
+            return "\0raw" + str(len(raw) - 1)
+        raise TypeError("Object of type " + type(o).__name__ + " is not JSON serializable")
+
+    text = json.dumps(obj, default=placeholder)
+    for i, fragment in enumerate(raw):
+        text = text.replace('"\\u0000raw' + str(i) + '"', fragment, 1)
+    return text
@@ -0,0 +1,374 @@
+import json
+import mmap
+import os
+import pickle
+import struct
+import numpy as np
+
+##
+#
+#    @brief Binary file format of graphs, for GraphAdjList.save() and
+#        GraphAdjList.load()
+#
+#    A graph file is a 64 byte header followed by arrays, each starting on
+#    a multiple of 8 bytes, in this order:
+#
+#    - offsets (int64, num_vertices+1) and targets (int64, num_edges): the
+#      adjacency of the graph in compressed sparse row form (see GraphCSR)
+#    - weights (float64, num_edges), if some edges hold data: the edge data,
+#      NaN for edges without data; the INT_WEIGHTS flag tells they were all
+#      int (and are exact, below 2^53)
+#    - locations (float64, num_vertices x 2), if some vertices are located:
+#      x, y of each vertex, NaN for vertices without location
+#    - keys: int64 keys, or a string table of the keys
+#    - values, if some vertices hold data: a string table of the vertex
+#      data, as JSON text or, when some data would not come back unchanged
+#      from JSON (tuples, dicts with non str keys, ...), as pickles
+#
+#    A string table is an array of num_vertices+1 int64 offsets followed by
+#    the bytes of the strings; string i is bytes offsets[i] to offsets[i+1].
+#    The header holds the magic string, the format version, flags telling
+#    which of the optional arrays are present, num_vertices and num_edges.
+#
+#    read_graph() can memory map the file: the arrays are then views of the
+#    file, pages are read when first used and shared by all the processes
+#    using the same file, and strings are decoded one by one when needed.
+#
+#    read_edge_list() reads the plain text edge lists graph data sets are
+#    often distributed as.
+#
+#    \sa GraphAdjList.save(), GraphAdjList.load(), GraphAdjList.from_edge_list()
+#
+
+MAGIC = b"BRIDGESG"
+VERSION = 1
+_HEADER = struct.Struct("<8sIIQQ")
+_HEADER_SIZE = 64
+
+WEIGHTED = 1
+LOCATED = 2
+INT_KEYS = 4
+JSON_VALUES = 8
+PICKLED_VALUES = 16
+INT_WEIGHTS = 32
+
+
+class StringTable:
+    """
+    Read only sequence of the strings (or pickled objects) of a string
+    table, decoded when accessed
+    """
+
+    def __init__(self, offsets, data, decode) -> None:
+        self._offsets = offsets
+        self._data = data
+        self._decode = decode
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if i < 0 or i >= len(self):
+            raise IndexError("string table index out of range")
+        return self._decode(self._data[int(self._offsets[i]):int(self._offsets[i + 1])])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+def _string_table(items) -> tuple:
+    offsets = np.zeros(len(items) + 1, dtype="<i8")
+    np.cumsum([len(b) for b in items], out=offsets[1:])
+    return offsets, b"".join(items)
+
+
+def _json_round_trips(v) -> bool:
+    try:
+        back = json.loads(json.dumps(v))
+    except (TypeError, ValueError):
+        return False
+    return type(back) is type(v) and back == v
+
+
+def write_graph(path: str, keys: list, offsets, targets, weights=None, locations=None, values=None,
+                int_weights: bool = False) -> None:
+    """
+    Write a graph file
+    Args:
+        path: file to write
+        keys: vertex keys, in index order; all int or all str
+        offsets: CSR offsets
+        targets: CSR targets
+        weights: edge data in the order of targets (NaN for no data), or None
+        locations: (num_vertices x 2) vertex locations (NaN if none), or None
+        values: vertex data in index order, or None
+        int_weights: whether the edge data are all int, to be read back as
+         int
+    Returns:
+        None
+    Raises:
+        ValueError: if the keys are neither all int nor all str
+    """
+    flags = 0
+    arrays = [np.asarray(offsets, dtype="<i8"), np.asarray(targets, dtype="<i8")]
+    if weights is not None:
+        flags |= WEIGHTED
+        if int_weights:
+            flags |= INT_WEIGHTS
+        arrays.append(np.asarray(weights, dtype="<f8"))
+    if locations is not None:
+        flags |= LOCATED
+        arrays.append(np.asarray(locations, dtype="<f8").reshape(-1, 2))
+
+    if all(type(k) is int for k in keys):
+        flags |= INT_KEYS
+        arrays.append(np.array(keys, dtype="<i8"))
+    elif all(isinstance(k, str) for k in keys):
+        arrays.extend(_string_table([k.encode() for k in keys]))
+    else:
+        raise ValueError("Only graphs whose vertex keys are all int or all str can be saved")
+
+    if values is not None:
+        if all(_json_round_trips(v) for v in values):
+            items = [json.dumps(v).encode() for v in values]
+            flags |= JSON_VALUES
+        else:
+            items = [pickle.dumps(v) for v in values]
+            flags |= PICKLED_VALUES
+        arrays.extend(_string_table(items))
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, flags, len(keys), len(targets)).ljust(_HEADER_SIZE, b"\0"))
+        for a in arrays:
+            data = a if isinstance(a, bytes) else a.tobytes()
+            f.write(data)
+            f.write(b"\0" * (-len(data) % 8))
+
+
+class GraphFile:
+    """
+    Content of a graph file, see read_graph(); the optional arrays are
+    None when absent
+    """
+
+    def __init__(self, keys, offsets, targets, weights, locations, values, int_weights=False) -> None:
+        self.keys = keys
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        # whether the weights were all int
+        self.int_weights = int_weights
+        self.locations = locations
+        self.values = values
+
+
+def read_graph(path: str, use_mmap: bool = True) -> GraphFile:
+    """
+    Read a graph file
+    Args:
+        path: file to read
+        use_mmap: whether to memory map the file rather than read it all
+    Returns:
+        GraphFile: the arrays of the file, and sequences of its keys and
+        values (None if the vertices hold no data)
+    Raises:
+        ValueError: if the file is not a graph file of a known version
+    """
+    with open(path, "rb") as f:
+        if use_mmap:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buf = f.read()
+    if len(buf) < _HEADER_SIZE:
+        raise ValueError(path + " is not a graph file")
+    magic, version, flags, n, m = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(path + " is not a graph file of version " + str(VERSION))
+
+    pos = _HEADER_SIZE
+
+    def take(dtype, count):
+        nonlocal pos
+        a = np.frombuffer(buf, dtype=dtype, count=count, offset=pos)
+        pos += a.nbytes + (-a.nbytes % 8)
+        return a
+
+    def take_table(decode):
+        nonlocal pos
+        offsets = take("<i8", n + 1)
+        data = memoryview(buf)[pos:pos + int(offsets[-1])]
+        pos += int(offsets[-1]) + (-int(offsets[-1]) % 8)
+        return StringTable(offsets, data, decode)
+
+    offsets = take("<i8", n + 1)
+    targets = take("<i8", m)
+    weights = take("<f8", m) if flags & WEIGHTED else None
+    locations = take("<f8", 2 * n).reshape(n, 2) if flags & LOCATED else None
+    if flags & INT_KEYS:
+        keys = take("<i8", n).tolist()
+    else:
+        keys = take_table(lambda b: str(b, "utf-8"))
+    values = None
+    if flags & JSON_VALUES:
+        values = take_table(lambda b: json.loads(str(b, "utf-8")))
+    elif flags & PICKLED_VALUES:
+        values = take_table(lambda b: pickle.loads(b))
+    return GraphFile(keys, offsets, targets, weights, locations, values, bool(flags & INT_WEIGHTS))
+
+
+_COMMENTS = (b"#", b"%")
+# larger integers are not exact as float64
+_EXACT_INTS = float(1 << 53)
+
+
+class _NotNumeric(Exception):
+    # an id of an edge list that was read as numeric is not an integer
+    pass
+
+
+def _as_int(field):
+    try:
+        return int(field)
+    except ValueError:
+        raise _NotNumeric()
+
+
+def _parse_lines(lines, delimiter, weighted, intern):
+    srcs = []
+    dests = []
+    weights = []
+    for line in lines:
+        fields = line.split(delimiter)
+        try:
+            src = intern(fields[0])
+            dest = intern(fields[1])
+            if weighted:
+                weights.append(float(fields[2]))
+        except (ValueError, IndexError):
+            raise ValueError("Edge list line not understood: " + str(line, "utf-8", "replace"))
+        srcs.append(src)
+        dests.append(dest)
+    return srcs, dests, weights
+
+
+def read_edge_list(path: str, delimiter: str = None, weighted: bool = False, progress: bool = None,
+                   chunk_size: int = 1 << 26):
+    """
+    Read an edge list file: one edge per line, source and destination
+    vertex ids (and a weight, if weighted) separated by delimiter; further
+    fields are ignored, as are empty lines and lines starting with # or %
+    (SNAP and MatrixMarket comments). The file is read in chunks; while all
+    the ids are integers, each chunk is parsed as one array of numbers. If
+    an id turns out not to be an integer, the file is read again with
+    string ids.
+    Args:
+        path: file to read
+        delimiter: field separator, None for any whitespace
+        weighted: whether the third field is the edge weight
+        progress: whether to print the progress, None to print it for
+         files larger than 256 MB
+        chunk_size: number of bytes read at once
+    Returns:
+        (keys, sources, destinations, weights): the vertex keys (int when
+        all ids are integers, in increasing order, else str, in order of
+        appearance), arrays of the source and destination indices in keys,
+        and the array of weights (None if not weighted)
+    Raises:
+        ValueError: if a line does not hold enough fields
+    """
+    size = os.path.getsize(path)
+    if progress is None:
+        progress = size > (1 << 28)
+    sep = None if delimiter is None else delimiter.encode()
+    try:
+        return _read_edge_list(path, sep, weighted, progress, chunk_size, size, True)
+    except _NotNumeric:
+        return _read_edge_list(path, sep, weighted, progress, chunk_size, size, False)
+
+
+def _read_edge_list(path, sep, weighted, progress, chunk_size, size, numeric):
+    # numeric is None to decide from the first line, False for string ids;
+    # raises _NotNumeric if ids read as integers turn out not to be
+    numeric = None if numeric else False
+    columns = None
+    num_srcs = []
+    num_dests = []
+    index = dict()
+    str_srcs = []
+    str_dests = []
+    weights = []
+
+    def intern(field):
+        k = str(field.strip(), "utf-8")
+        i = index.get(k)
+        if i is None:
+            i = index[k] = len(index)
+        return i
+
+    done = 0
+    rest = b""
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(chunk_size)
+            done += len(block)
+            text = rest + block
+            if block:
+                cut = text.rfind(b"\n") + 1
+                text, rest = text[:cut], text[cut:]
+            if text:
+                lines = [line for line in text.split(b"\n") if line.strip() and not line.lstrip().startswith(_COMMENTS)]
+                if lines and numeric is None:
+                    fields = lines[0].split(sep)
+                    columns = len(fields)
+                    try:
+                        int(fields[0])
+                        int(fields[1])
+                        numeric = True
+                    except (ValueError, IndexError):
+                        numeric = False
+                if lines and numeric:
+                    chunk = b" ".join(lines)
+                    if sep is not None:
+                        chunk = chunk.replace(sep, b" ")
+                    try:
+                        values = np.fromstring(str(chunk, "ascii"), dtype=np.float64, sep=" ")
+                    except ValueError:
+                        values = np.zeros(0)
+                    exact = False
+                    if len(values) == len(lines) * columns and columns >= (3 if weighted else 2):
+                        values = values.reshape(-1, columns)
+                        ids = values[:, :2]
+                        # ids must be integers small enough to be exact
+                        exact = bool((np.abs(ids) < _EXACT_INTS).all() and (ids == np.floor(ids)).all())
+                    if exact:
+                        num_srcs.append(values[:, 0].astype(np.int64))
+                        num_dests.append(values[:, 1].astype(np.int64))
+                        if weighted:
+                            weights.append(values[:, 2])
+                    else:
+                        s, d, w = _parse_lines(lines, sep, weighted, _as_int)
+                        num_srcs.append(np.array(s, dtype=np.int64))
+                        num_dests.append(np.array(d, dtype=np.int64))
+                        weights.append(np.array(w, dtype=np.float64))
+                elif lines:
+                    s, d, w = _parse_lines(lines, sep, weighted, intern)
+                    str_srcs.extend(s)
+                    str_dests.extend(d)
+                    weights.append(np.array(w, dtype=np.float64))
+            if progress and block:
+                print("\r" + path + ": " + str(100 * done // max(size, 1)) + "%", end="", flush=True)
+            if not block:
+                break
+    if progress:
+        print()
+
+    weights = np.concatenate(weights) if weighted and weights else (np.zeros(0) if weighted else None)
+    if numeric:
+        ids = np.concatenate(num_srcs + num_dests)
+        keys, inverse = np.unique(ids, return_inverse=True)
+        m = len(ids) // 2
+        return keys.tolist(), inverse[:m], inverse[m:], weights
+    return list(index), np.array(str_srcs, dtype=np.int64), np.array(str_dests, dtype=np.int64), weights
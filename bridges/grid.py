@@ -34,12 +34,7 @@ class Grid:
             ValueError: if the size dimensions are greater than the max grid sizes (1080, 1920)
         """
         if 'size' in kwargs:
-            if (kwargs['size'][0] <= 0 or kwargs['size'][0] > Grid.maxGridSize[0]) or \
-                    (kwargs['size'][1] <= 0 or kwargs['size'][1] > Grid.maxGridSize[1]):
-                raise ValueError("Invalid size: [" + str(
-                    str(kwargs['size'][0]) + "," + str(kwargs['size'][1]) + "] .. please use values between (0 and " +
-                    str(self.maxGridSize[0]) + "] for rows and values between (0 and " + str(
-                        self.maxGridSize[1]) + "] for columns"))
+            Grid.validate_size(kwargs['size'][0], kwargs['size'][1])
             self.grid = []
             for i in range(kwargs['size'][0]):
                 self.grid.append([])
@@ -47,17 +42,31 @@ class Grid:
                     self.grid[i].append(None)
         if 'rows' in kwargs and 'cols' in kwargs:
             size = [kwargs['rows'], kwargs['cols']]
-            if (size[0] <= 0 or size[0] > self.maxGridSize[0]) or (size[1] <= 0 or size[1] > self.maxGridSize[1]):
-                raise ValueError("Invalid size: [" + str(
-                    str(size[0]) + "," + str(size[1]) + "] .. please use values between (0 and " + str(
-                        self.maxGridSize[0]) + "] for rows and values between (0 and " + str(
-                        self.maxGridSize[1]) + "] for columns"))
+            Grid.validate_size(size[0], size[1])
             self.grid = []
             for i in range(size[0]):
                 self.grid.append([])
                 for j in range(size[1]):
                     self.grid[i].append(None)
 
+    @staticmethod
+    def validate_size(rows: int, cols: int) -> None:
+        """
+        Check that a grid of the given size can be displayed
+        Args:
+            rows: number of rows in grid
+            cols: number of the columns in grid
+        Returns:
+            None
+        Raises:
+            ValueError: if the size dimensions are greater than the max grid sizes (1080, 1920)
+        """
+        if (rows <= 0 or rows > Grid.maxGridSize[0]) or (cols <= 0 or cols > Grid.maxGridSize[1]):
+            raise ValueError("Invalid size: [" + str(
+                str(rows) + "," + str(cols) + "] .. please use values between (0 and " + str(
+                    Grid.maxGridSize[0]) + "] for rows and values between (0 and " + str(
+                    Grid.maxGridSize[1]) + "] for columns"))
+
     @property
     def dimensions(self) -> list:
         """
@@ -0,0 +1,265 @@
+import math
+import numpy as np
+from bridges.graph_csr import GraphCSR
+
+##
+#
+#    @brief Local force directed layout of graphs
+#
+#    The largegraph representation of GraphAdjList is only used when every
+#    vertex has a location. force_directed_layout() computes locations for
+#    graphs that have no natural ones, and GraphAdjList.set_locations()
+#    assigns them in bulk:
+#
+#    @code
+#    locations = layout.force_directed_layout(graph)
+#    graph.set_locations(locations)
+#    @endcode
+#
+#    The layout is a Fruchterman-Reingold spring embedder. Repulsion between
+#    all pairs of vertices is approximated Barnes-Hut style on a quadtree of
+#    uniform levels: vertices in neighboring cells of the finest level repel
+#    each other exactly, farther vertices only through the centroid of the
+#    largest cell that is well separated from them. Every step of the
+#    simulation is a handful of array operations per quadtree level.
+#
+#    With multilevel layout, the graph is first coarsened repeatedly by
+#    collapsing stars (a vertex of locally highest degree absorbs its
+#    neighbors), the coarsest graph is laid out, and each level is then
+#    initialized from the one above and refined.
+#
+#    \sa GraphAdjList.set_locations()
+#
+
+def _snapshot(gr) -> GraphCSR:
+    if isinstance(gr, GraphCSR):
+        return gr
+    return gr.freeze()
+
+
+def _undirected_edges(n, srcs, dests):
+    # every pair of adjacent vertices once, without loops
+    lo = np.minimum(srcs, dests)
+    hi = np.maximum(srcs, dests)
+    pairs = np.unique((lo * n + hi)[lo != hi])
+    return pairs // n, pairs % n
+
+
+def _interaction_offsets():
+    # the cells that interact through their centroid with a cell of a level
+    # are the children of the neighbors of its parent that are not its own
+    # neighbors; their offsets depend on the parity of the cell coordinates
+    ret = dict()
+    for a in (0, 1):
+        for b in (0, 1):
+            ret[a, b] = [(ox - a, oy - b) for ox in range(-2, 4) for oy in range(-2, 4)
+                         if abs(ox - a) > 1 or abs(oy - b) > 1]
+    return ret
+
+
+_offsets = _interaction_offsets()
+
+# strength of the pull toward the center of mass
+GRAVITY = 1.0
+
+
+def _repulsion(x, y, mass, max_depth=10):
+    n = len(x)
+    fx = np.zeros(n)
+    fy = np.zeros(n)
+    x0 = x.min()
+    y0 = y.min()
+    span = max(float(x.max() - x0), float(y.max() - y0), 1e-9) * (1 + 1e-9)
+
+    # refine the quadtree until the vertices in neighboring cells of the
+    # finest level are few enough to be handled pairwise
+    level = 1
+    finest = False
+    while not finest:
+        level += 1
+        g = 1 << level
+        # cells are numbered on a grid padded by 2 empty cells on each side,
+        # so that the offsets of neighbors never fall out of the grid
+        side = g + 4
+        cx = np.minimum(((x - x0) * (g / span)).astype(np.int64), g - 1)
+        cy = np.minimum(((y - y0) * (g / span)).astype(np.int64), g - 1)
+        cells, point_cell = np.unique((cx + 2) * side + cy + 2, return_inverse=True)
+        cell_mass = np.zeros(side * side)
+        cell_mass[cells] = np.bincount(point_cell, weights=mass)
+        occupancy = np.bincount(point_cell)
+        finest = level >= max_depth or int((occupancy * occupancy).sum()) <= 3 * n
+        cx_mass = np.zeros(side * side)
+        cy_mass = np.zeros(side * side)
+        cx_mass[cells] = np.bincount(point_cell, weights=mass * x) / cell_mass[cells]
+        cy_mass[cells] = np.bincount(point_cell, weights=mass * y) / cell_mass[cells]
+
+        # far field of the level, evaluated at the centroid of each cell
+        cell_fx = np.zeros(len(cells))
+        cell_fy = np.zeros(len(cells))
+        parity_x = (cells // side) % 2
+        parity_y = (cells % side) % 2
+        for (a, b), offsets in _offsets.items():
+            sel = np.nonzero((parity_x == a) & (parity_y == b))[0]
+            base = cells[sel]
+            hx = cx_mass[base]
+            hy = cy_mass[base]
+            sx = np.zeros(len(sel))
+            sy = np.zeros(len(sel))
+            for ox, oy in offsets:
+                other = base + (ox * side + oy)
+                dx = hx - cx_mass[other]
+                dy = hy - cy_mass[other]
+                w = cell_mass[other] / np.maximum(dx * dx + dy * dy, 1e-9)
+                sx += dx * w
+                sy += dy * w
+            cell_fx[sel] = sx
+            cell_fy[sel] = sy
+        fx += cell_fx[point_cell]
+        fy += cell_fy[point_cell]
+
+    # near field: exact between the vertices of neighboring cells of the
+    # finest level
+    order = np.argsort(point_cell, kind="stable")
+    counts = np.zeros(side * side, dtype=np.int64)
+    counts[cells] = occupancy
+    starts = np.zeros(side * side, dtype=np.int64)
+    starts[cells] = np.searchsorted(point_cell[order], np.arange(len(cells)))
+    point_cell = cells[point_cell]
+    pairs_i = []
+    pairs_j = []
+    idx = np.arange(n)
+    for ox in (-1, 0, 1):
+        for oy in (-1, 0, 1):
+            cell = point_cell + (ox * side + oy)
+            cnt = counts[cell]
+            # each vertex paired with every vertex of the neighbor cell
+            shift = np.repeat(starts[cell] - np.cumsum(cnt) + cnt, cnt)
+            pairs_i.append(np.repeat(idx, cnt))
+            pairs_j.append(order[np.arange(cnt.sum()) + shift])
+    i = np.concatenate(pairs_i)
+    j = np.concatenate(pairs_j)
+    dx = x[i] - x[j]
+    dy = y[i] - y[j]
+    w = np.where(i != j, mass[j], 0.0) / np.maximum(dx * dx + dy * dy, 1e-9)
+    fx += np.bincount(i, weights=dx * w, minlength=n)
+    fy += np.bincount(i, weights=dy * w, minlength=n)
+    return fx, fy
+
+
+def _attraction(x, y, srcs, dests):
+    n = len(x)
+    dx = x[dests] - x[srcs]
+    dy = y[dests] - y[srcs]
+    length = np.sqrt(dx * dx + dy * dy)
+    fx = np.bincount(srcs, weights=dx * length, minlength=n) - np.bincount(dests, weights=dx * length, minlength=n)
+    fy = np.bincount(srcs, weights=dy * length, minlength=n) - np.bincount(dests, weights=dy * length, minlength=n)
+    return fx, fy
+
+
+def _refine(pos, mass, srcs, dests, iterations, temperature):
+    x = pos[:, 0].copy()
+    y = pos[:, 1].copy()
+    total = mass.sum()
+    for it in range(iterations):
+        rx, ry = _repulsion(x, y, mass)
+        ax, ay = _attraction(x, y, srcs, dests)
+        # weak pull toward the center of mass, so that vertices without
+        # edges and small components stay next to the rest
+        gx = GRAVITY * mass * ((mass * x).sum() / total - x)
+        gy = GRAVITY * mass * ((mass * y).sum() / total - y)
+        fx = rx + ax + gx
+        fy = ry + ay + gy
+        length = np.maximum(np.sqrt(fx * fx + fy * fy), 1e-9)
+        scale = np.minimum(length, temperature * (1 - it / iterations)) / length
+        x += fx * scale
+        y += fy * scale
+    return np.column_stack((x, y))
+
+
+def _coarsen(n, srcs, dests, mass, rng):
+    # star collapse: each vertex points to its neighbor of highest degree
+    # (ties broken at random); the vertices pointing to themselves are the
+    # centers and absorb the neighbors pointing to them, then the vertices
+    # left join their neighboring center of highest degree, if any
+    degree = np.bincount(srcs, minlength=n) + np.bincount(dests, minlength=n)
+    rank = degree * n + rng.permutation(n)
+    vertex_of_rank = np.empty(n, dtype=np.int64)
+    vertex_of_rank[rank % n] = np.arange(n)
+
+    best = rank.copy()
+    np.maximum.at(best, srcs, rank[dests])
+    np.maximum.at(best, dests, rank[srcs])
+    target = vertex_of_rank[best % n]
+    center = target == np.arange(n)
+    group = np.where(center[target], target, -1)
+
+    best = np.full(n, -1, dtype=np.int64)
+    center_rank = np.where(center, rank, -1)
+    np.maximum.at(best, srcs, center_rank[dests])
+    np.maximum.at(best, dests, center_rank[srcs])
+    left = group == -1
+    joins = left & (best >= 0)
+    group[joins] = vertex_of_rank[best[joins] % n]
+    group[left & ~joins] = np.nonzero(left & ~joins)[0]
+
+    groups, group = np.unique(group, return_inverse=True)
+    coarse_mass = np.bincount(group, weights=mass)
+    coarse_srcs, coarse_dests = _undirected_edges(len(groups), group[srcs], group[dests])
+    return group, coarse_mass, coarse_srcs, coarse_dests
+
+
+def force_directed_layout(gr, iterations: int = 50, multilevel: bool = True, extent: float = 1000.0,
+                          seed: int = None):
+    """
+    Compute a force directed layout of a graph (edges are considered
+    undirected)
+    Args:
+        gr: GraphAdjList, SubgraphView or GraphCSR
+        iterations: number of simulation steps; with multilevel layout, levels
+         of more than 1000 vertices take fewer
+        multilevel: whether to lay out successively coarsened graphs first,
+         much faster to untangle big graphs
+        extent: the layout is scaled to fit in a square of this side,
+         starting at (0, 0); the 1% outermost vertices on each side are
+         placed on its border
+        seed: seed of the random initial placement
+    Returns:
+        (num_vertices x 2) array of x, y locations, in vertex index order
+        (the order of GraphAdjList.key_set())
+    """
+    csr = _snapshot(gr)
+    n = csr.num_vertices
+    rng = np.random.default_rng(seed)
+    if n == 0:
+        return np.zeros((0, 2))
+    srcs, dests = _undirected_edges(n, csr.sources(), csr.targets)
+
+    hierarchy = [(n, np.ones(n), srcs, dests, None)]
+    while multilevel and hierarchy[-1][0] > 100:
+        size, mass, s, d, _ = hierarchy[-1]
+        group, coarse_mass, cs, cd = _coarsen(size, s, d, mass, rng)
+        if len(coarse_mass) > 0.9 * size:
+            break
+        hierarchy[-1] = (size, mass, s, d, group)
+        hierarchy.append((len(coarse_mass), coarse_mass, cs, cd, None))
+
+    # ideal edge length is 1, so the layout spans about sqrt(n)
+    size, mass, s, d, _ = hierarchy[-1]
+    pos = rng.uniform(0, math.sqrt(mass.sum()), (size, 2))
+    pos = _refine(pos, mass, s, d, iterations, math.sqrt(mass.sum()) / 10)
+    for size, mass, s, d, group in reversed(hierarchy[:-1]):
+        # start from the location of the coarse vertex, slightly spread out
+        pos = pos[group] + rng.uniform(-0.5, 0.5, (size, 2))
+        # big levels only need a few steps to settle locally
+        steps = max(5, int(iterations * min(1.0, math.sqrt(1000 / size))))
+        pos = _refine(pos, mass, s, d, steps, 1.0)
+
+    # scale the bulk of the layout to the extent; the few vertices beyond
+    # the 1st and 99th percentiles are brought back to its border
+    lo = np.percentile(pos, 1, axis=0) if n >= 100 else pos.min(axis=0)
+    hi = np.percentile(pos, 99, axis=0) if n >= 100 else pos.max(axis=0)
+    span = float((hi - lo).max())
+    pos -= lo
+    if span > 0:
+        pos *= extent / span
+    return np.clip(pos, 0, extent)
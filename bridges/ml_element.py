@@ -158,12 +158,12 @@ class MLelement(SLelement):
                 #  sub list
                 if chld is not None:
                     #  add the link
-                    links_JSON.append(self.get_link_representation(par.get_link_visualizer(chld),
+                    links_JSON.append(self.get_link_representation(par.peek_link_visualizer(chld),
                                                                    str(node_map.get(par)), str(node_map.get(chld))))
             chld = par.next
             if chld is not None:
                 #  add the link
-                links_JSON.append(self.get_link_representation(par.get_link_visualizer(chld),
+                links_JSON.append(self.get_link_representation(par.peek_link_visualizer(chld),
                                                                str(node_map.get(par)), str(node_map.get(chld))))
         json_dict = {
             "nodes": nodes_JSON,
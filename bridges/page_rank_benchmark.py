@@ -1,4 +1,5 @@
 from bridges.graph_benchmark import *
+from bridges import algorithms
 from bridges.line_chart import *
 from datetime import datetime
 import time as time_
@@ -14,26 +15,27 @@ class PageRankBenchmark(GraphBenchmark):
     def run(self, algoname, paralgo):
         time = []
         vtx_count = []
-        edge_count = []
+        edge_cnt = []
 
-        years = 0
-        while years < 120:
-            year = 2019 - years
-            graph = GraphAdjList()
-            vertex_count, edge_count = self._genertate_wiki_data_movie_actor(year, 2019, graph)
+        for graph, vertex_count, edge_count in self._input_graphs():
             pr = dict()
             start = int(round(time_.time() * 1000))
             paralgo(graph, pr)
             end = int(round(time_.time() * 1000))
             elapsed_time = end - start
+            if self.validate:
+                ref_pr = dict()
+                algorithms.page_rank(graph, ref_pr)
+                if pr.keys() != ref_pr.keys() or \
+                        any(abs(pr[k] - ref_pr[k]) > 1e-4 for k in ref_pr):
+                    self._report_mismatch(algoname, "ranks", edge_count)
 
             time.append(elapsed_time)
             vtx_count.append(vertex_count)
-            edge_count.append(edge_count)
+            edge_cnt.append(edge_count)
 
             if elapsed_time > self.time_cap:
                 break
-            years = 1.2 * years + 1
 
-        self.__plot.set_x_data(algoname, edge_count)
+        self.__plot.set_x_data(algoname, edge_cnt)
         self.__plot.set_y_data(algoname, time)
\ No newline at end of file
@@ -0,0 +1,284 @@
+import heapq
+import numpy as np
+from bridges.graph_csr import GraphCSR
+from bridges import algorithms
+
+##
+#
+#    @brief A part of a GraphAdjList, without copying it
+#
+#    A SubgraphView is defined by a set of vertices of a graph and an
+#    optional edge filter: it holds the vertices of the set, and the edges
+#    between them that the filter accepts. Nothing of the graph is copied:
+#    the view finds its vertices and edges in the snapshot of the graph
+#    (see GraphAdjList.freeze()) as index arrays, and is recomputed when
+#    the graph changes. Vertex elements, link styles and visualizers are
+#    those of the graph.
+#
+#    A view has the read methods of GraphAdjList (key_set(),
+#    out_going_edge_set_of(), degree(), ...) and freeze(), so it can be
+#    passed to the functions of algorithms and layout, and it can be
+#    handed to Bridges.set_data_structure() to visualize only that part of
+#    the graph:
+#
+#    @code
+#    bridges.set_data_structure(SubgraphView.component(graph, "some vertex"))
+#    @endcode
+#
+#    \sa GraphAdjList.subgraph(), GraphAdjList.set_level_of_detail()
+#
+class SubgraphView:
+
+    def __init__(self, graph, vertices=None, edge_filter=None) -> None:
+        """
+        Constructor of a view of a graph
+        Args:
+            graph: the GraphAdjList
+            vertices: the vertex keys in the view, or a boolean numpy array
+             telling for each vertex (in key_set() order) whether it is in
+             the view; None for all the vertices of the graph, even those
+             added later
+            edge_filter: function called with each Edge between vertices
+             of the view, returning whether it is in the view; None to keep
+             all of them
+        Raises:
+            ValueError: if some of the vertices do not exist (all are
+             listed), or the mask is not as long as the graph has vertices
+        """
+        self._graph = graph
+        self._edge_filter = edge_filter
+        csr = graph.freeze()
+        if vertices is None:
+            self._members = None
+        elif isinstance(vertices, np.ndarray) and vertices.dtype == bool:
+            if len(vertices) != csr.num_vertices:
+                raise ValueError("Got a mask of " + str(len(vertices)) + " values for " +
+                                 str(csr.num_vertices) + " vertices")
+            keys = csr.keys
+            self._members = [keys[i] for i in np.nonzero(vertices)[0].tolist()]
+        else:
+            self._members = vertices.tolist() if hasattr(vertices, "tolist") else list(vertices)
+            missing = []
+            for k in self._members:
+                try:
+                    csr.index_of(k)
+                except KeyError:
+                    missing.append(k)
+            if missing:
+                raise ValueError("Vertices " + ", ".join(str(k) for k in missing) +
+                                 " do not exist! First add the vertices to the graph.")
+        self._mask = None
+        self._edges = None
+        self._view = None
+        self._view_version = -1
+        self._csr = None
+        self._csr_version = -1
+
+    @staticmethod
+    def component(graph, key) -> "SubgraphView":
+        """
+        View of the connected component of a vertex, ignoring the direction
+        of edges
+        Args:
+            graph: the GraphAdjList
+            key: a vertex of the component
+        Returns:
+            SubgraphView
+        """
+        comp = algorithms.component_array(graph)
+        return SubgraphView(graph, comp == comp[graph.freeze().index_of(key)])
+
+    @staticmethod
+    def neighborhood(graph, roots, hops: int = 1) -> "SubgraphView":
+        """
+        View of the vertices at most hops edges (in either direction) away
+        from the roots
+        Args:
+            graph: the GraphAdjList
+            roots: keys of the vertices to start from
+            hops: distance to the roots
+        Returns:
+            SubgraphView
+        """
+        csr = graph.freeze()
+        srcs = csr.sources()
+        dests = csr.targets
+        keep = np.zeros(csr.num_vertices, dtype=bool)
+        keep[[csr.index_of(k) for k in roots]] = True
+        for _ in range(hops):
+            reached = keep.copy()
+            reached[dests[keep[srcs]]] = True
+            reached[srcs[keep[dests]]] = True
+            keep = reached
+        return SubgraphView(graph, keep)
+
+    @property
+    def graph(self):
+        """
+        Getter for the graph this is a view of
+        Returns:
+            GraphAdjList
+        """
+        return self._graph
+
+    def _visible(self):
+        # arrays of the indices in the graph of the vertices of the view
+        # (sorted), and of the sources and destinations of its edges, as
+        # GraphAdjList._visible() gives them
+        graph = self._graph
+        if self._view_version == graph._version:
+            return self._view
+        csr = graph.freeze()
+        n = csr.num_vertices
+        if self._members is None:
+            mask = np.ones(n, dtype=bool)
+        else:
+            mask = np.zeros(n, dtype=bool)
+            index = []
+            for k in self._members:
+                # vertices removed from the graph leave the view
+                try:
+                    index.append(csr.index_of(k))
+                except KeyError:
+                    pass
+            mask[index] = True
+        srcs = csr.sources()
+        dests = csr.targets
+        edges = np.nonzero(mask[srcs] & mask[dests])[0]
+        if self._edge_filter is not None and len(edges):
+            keys = csr.keys
+            adj = graph._adj
+            accept = self._edge_filter
+            keep = [bool(accept(adj[keys[s]][keys[d]])) for s, d in zip(srcs[edges].tolist(), dests[edges].tolist())]
+            edges = edges[np.array(keep, dtype=bool)]
+        self._mask = mask
+        self._edges = edges
+        self._view = (np.nonzero(mask)[0], srcs[edges], dests[edges])
+        self._view_version = graph._version
+        return self._view
+
+    def _index_in_view(self, key):
+        # index of a vertex in the graph, None if it is not in the view
+        self._visible()
+        try:
+            i = self._graph.freeze().index_of(key)
+        except KeyError:
+            return None
+        return i if self._mask[i] else None
+
+    def freeze(self) -> GraphCSR:
+        """
+        Get the compressed sparse row snapshot of the view, numbering its
+        vertices in key_set() order; it is rebuilt after the graph changed
+        Returns:
+            GraphCSR: snapshot of the view
+        """
+        shown, srcs, dests = self._visible()
+        if self._csr is None or self._csr_version != self._view_version:
+            csr = self._graph.freeze()
+            keys = csr.keys
+            weights = None if csr.weights is None else csr.weights[self._edges]
+            self._csr = GraphCSR.from_edges(len(shown), np.searchsorted(shown, srcs), np.searchsorted(shown, dests),
+                                            weights, [keys[i] for i in shown.tolist()])
+            self._csr_version = self._view_version
+        return self._csr
+
+    @property
+    def vertices(self) -> dict:
+        """
+        Getter for the vertices of the view; the elements are those of the
+        graph
+        Returns:
+            dict: vertex key to vertex element
+        """
+        vertices = self._graph.vertices
+        return {k: vertices[k] for k in self.key_set()}
+
+    def key_set(self) -> list:
+        return list(self.freeze().keys)
+
+    def get_vertex(self, key):
+        if self._index_in_view(key) is None:
+            return None
+        return self._graph.get_vertex(key)
+
+    def get_vertex_data(self, key):
+        return self._graph.get_vertex_data(key)
+
+    def out_going_edge_set_of(self, k) -> list:
+        if self._index_in_view(k) is None:
+            raise KeyError(k)
+        accept = self._edge_filter
+        return [e for e in self._graph.out_going_edge_set_of(k)
+                if self._index_in_view(e.tov) is not None and (accept is None or accept(e))]
+
+    def get_edge_data(self, src, dest):
+        for e in self.out_going_edge_set_of(src):
+            if e.tov == dest:
+                return e.edge_data
+
+    def degree(self, k) -> int:
+        """
+        Out degree of a vertex in the view
+        Args:
+            k: the vertex key
+        Returns:
+            int: number of edges of the view leaving the vertex
+        Raises:
+            KeyError: if the vertex is not in the view
+        """
+        csr = self.freeze()
+        return int(csr.out_degrees[csr.index_of(k)])
+
+    def edge_count(self) -> int:
+        """
+        Number of edges of the view
+        Returns:
+            int
+        """
+        return len(self._visible()[1])
+
+    def top_k_by_degree(self, k: int) -> list:
+        """
+        The vertices of the view of highest out degree in the view
+        Args:
+            k: number of vertices wanted
+        Returns:
+            list: keys of the (at most) k vertices of highest out degree, by
+            decreasing degree
+        """
+        csr = self.freeze()
+        degrees = csr.out_degrees.tolist()
+        return [csr.key_of(i) for i in heapq.nlargest(k, range(len(degrees)), key=degrees.__getitem__)]
+
+    def get_visualizer(self, vertex):
+        return self._graph.get_visualizer(vertex)
+
+    def get_link_visualizer(self, src, dest):
+        return self._graph.get_link_visualizer(src, dest)
+
+    def get_data_structure_type(self) -> str:
+        """
+        Getter for the data structure type, as the graph would have it
+        with only the vertices of the view
+        Returns:
+            str: representing the type
+        """
+        if self._graph._use_large_graph_view(self._visible()):
+            return "largegraph"
+        return "GraphAdjacencyList"
+
+    def get_data_structure_representation(self) -> dict:
+        """
+        Get the representation of the view as a dict, built from the
+        vertices and links of the graph that are in the view
+        Returns:
+            dict: representing the JSON format before dumping to server
+        """
+        graph = self._graph
+        view = self._visible()
+        if not graph._use_large_graph_view(view):
+            return graph._get_representation(view)
+        if graph._large_graph_encoding == "binary":
+            return graph._get_large_graph_binary(view)
+        return graph._get_large_graph(view)
@@ -159,7 +159,7 @@ class TreeElement(Element):
                     json_str += "{" + self.QUOTE + "name" + self.QUOTE + ":" + \
                         self.QUOTE + "NULL" + self.QUOTE + "}" + ","
                 else:
-                    lv = root.get_link_visualizer(root.get_child(k))
+                    lv = root.peek_link_visualizer(root.get_child(k))
                     json_str += "{"
                     if lv is not None:
                         json_str += self.QUOTE + "linkProperties" + self.QUOTE + ":" + "{" + \
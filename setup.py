@@ -19,6 +19,7 @@ setuptools.setup(
         'webcolors>=1.8.1',
         'python-socketio[client]>=4.3.0',
         'SPARQLWrapper>=1.8.4',
+        'numpy>=1.17',
     ],
     classifiers=[
         "Programming Language :: Python :: 3",